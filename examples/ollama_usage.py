@@ -57,9 +57,9 @@ def main():
     3. Run Ollama server:
        - ollama serve (default port 11434)
     
-    4. Use sv-agent:
-       - sv-agent chat --llm-provider ollama
-       - sv-agent ask "your question" --ollama-model codellama:13b
+    4. Use sv-agent (the CLI loads HuggingFace models, not Ollama):
+       - sv-agent --model /path/to/local/model chat
+       - sv-agent --model /path/to/local/model ask "your question"
     """)
 
 
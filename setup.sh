@@ -32,9 +32,8 @@ if command -v ollama &> /dev/null; then
     echo "To pull a model: ollama pull codellama:13b"
 else
     echo "ℹ Ollama not found. To use local LLMs:"
-    echo "  1. Install Ollama: https://ollama.ai"
-    echo "  2. Pull a model: ollama pull llama2:13b"
-    echo "  3. Run: sv-agent chat --llm-provider ollama"
+    echo "  1. Download a model: huggingface-cli download google/gemma-2b-it --local-dir models/gemma-2b-it"
+    echo "  2. Run: sv-agent --model models/gemma-2b-it chat"
 fi
 
 # Create output directory
@@ -46,5 +45,5 @@ echo ""
 echo "You can now use sv-agent:"
 echo "  sv-agent convert -o src/sv_agent/cwl"
 echo "  sv-agent chat"
-echo "  sv-agent chat --llm-provider ollama --ollama-model codellama:13b"
+echo "  sv-agent --model models/gemma-2b-it chat"
 echo "  sv-agent list"
\ No newline at end of file
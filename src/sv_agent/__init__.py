@@ -2,8 +2,23 @@
 
 __version__ = "0.1.0"
 
-from .agent import SVAgent
-from .chat import SVAgentChat
-from .notebook import SVAgentNotebook, create_agent
+# Public classes are imported on first access so that lightweight entry
+# points (``sv-agent --help``, ``sv_agent.main``) don't load awlkit and the
+# model stack up front.
+_LAZY_EXPORTS = {
+    "SVAgent": ".agent",
+    "SVAgentChat": ".chat",
+    "SVAgentNotebook": ".notebook",
+    "create_agent": ".notebook",
+}
 
-__all__ = ["SVAgent", "SVAgentChat", "SVAgentNotebook", "create_agent"]
\ No newline at end of file
+__all__ = ["SVAgent", "SVAgentChat", "SVAgentNotebook", "create_agent"]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
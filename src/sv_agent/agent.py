@@ -5,7 +5,7 @@ from typing import Dict, Any, Optional, List
 
 from awlkit import WDLToCWLConverter, WDLParser
 from awlkit.agents import Agent
-from .knowledge import SVKnowledgeBase
+from .knowledge import get_shared_knowledge_base
 
 
 class SVAgent(Agent):
@@ -18,7 +18,7 @@ class SVAgent(Agent):
         self.gatksv_path = Path(__file__).parent.parent.parent / "submodules" / "gatk-sv"
         self.converter = WDLToCWLConverter()
         self.parser = WDLParser()
-        self.knowledge = SVKnowledgeBase()
+        self.knowledge = get_shared_knowledge_base()
         
         # Domain-specific capabilities
         self.domain_capabilities = [
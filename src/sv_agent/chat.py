@@ -1,7 +1,10 @@
 """Chat interface for SV-Agent - Interactive domain-specific agent."""
 
 import asyncio
+import functools
 import json
+import os
+from pathlib import Path
 from typing import Dict, Any, Optional
 import re
 import logging
@@ -10,11 +13,55 @@ from awlkit.agents import ChatInterface
 from awlkit.llm.utils import format_prompt_for_sv_domain
 
 from .agent import SVAgent
-from .knowledge import SVKnowledgeBase
+from .knowledge import get_shared_knowledge_base
+from .matching import first_matching_tier
 
 
 logger = logging.getLogger(__name__)
 
+# Directories searched for a local model when none is configured
+_MODEL_DIRS = (
+    Path("models"),
+    Path(os.path.expanduser("~/.cache/huggingface")),
+    Path("/workspaces/sv-agent/models")
+)
+
+# Keyword rules for _parse_intent in priority order; the first intent in
+# this order wins regardless of where its keyword appears in the query.
+# Keywords match as substrings, so "run" also matches "running".
+_INTENT_KEYWORDS = (
+    ("explain", ("explain module", "describe module")),
+    ("convert", ("convert", "transform")),
+    ("analyze", ("analyze", "analysis")),
+    ("run", ("run", "execute")),
+    ("recommend", ("recommend", "best practice", "should i")),
+    ("troubleshoot", ("error", "failed", "problem", "troubleshoot")),
+    ("help", ("help", "what can you")),
+)
+_GENERAL_QUESTION_PREFIXES = (
+    "what is", "what are", "how do", "why", "when", "who", "define", "explain what"
+)
+
+# Queries mentioning a platform and an execution verb start a Seven
+# Bridges dialog
+_SB_KEYWORDS = ("seven bridges", "sb", "cgc", "cavatica", "platform", "cloud")
+_EXECUTION_KEYWORDS = ("run", "execute", "process")
+
+
+@functools.lru_cache(maxsize=1)
+def _find_local_model() -> Optional[str]:
+    """Find a local model directory, probing the disk once per process."""
+    for model_dir in _MODEL_DIRS:
+        if model_dir.exists():
+            # Look for any subdirectory that looks like a model
+            for item in model_dir.iterdir():
+                if item.is_dir() and any(f in item.name.lower() for f in ["gemma", "llama", "phi", "mistral"]):
+                    # Check if it has model files
+                    if any(item.glob("*.bin")) or any(item.glob("*.safetensors")) or (item / "config.json").exists():
+                        logger.info("Found local model: %s", item)
+                        return str(item)
+    return None
+
 
 class SVAgentChat(ChatInterface):
     """Interactive chat interface for SV-Agent."""
@@ -51,42 +98,15 @@ class SVAgentChat(ChatInterface):
             from awlkit.llm import get_huggingface_provider
             HuggingFaceProvider = get_huggingface_provider()
             
-            # Try to find local models intelligently
-            from pathlib import Path
-            import os
+            # First check if a model is specified in config, else look for
+            # local models in common locations
+            default_model = config.get("model_id") or _find_local_model()
             
-            default_model = None
+            # If no local model found, use a small public model
+            if not default_model:
+                default_model = "microsoft/phi-2"
+                logger.warning(f"No local model found, defaulting to {default_model}. This will download ~5GB on first use.")
             
-            # First check if a model is specified in config
-            if config.get("model_id"):
-                default_model = config["model_id"]
-            else:
-                # Look for local models in common locations
-                model_dirs = [
-                    Path("models"),
-                    Path("./models"),
-                    Path(os.path.expanduser("~/.cache/huggingface")),
-                    Path("/workspaces/sv-agent/models")
-                ]
-                
-                for model_dir in model_dirs:
-                    if model_dir.exists():
-                        # Look for any subdirectory that looks like a model
-                        for item in model_dir.iterdir():
-                            if item.is_dir() and any(f in item.name.lower() for f in ["gemma", "llama", "phi", "mistral"]):
-                                # Check if it has model files
-                                if any(item.glob("*.bin")) or any(item.glob("*.safetensors")) or (item / "config.json").exists():
-                                    default_model = str(item)
-                                    logger.info(f"Found local model: {default_model}")
-                                    break
-                        if default_model:
-                            break
-                
-                # If no local model found, use a small public model
-                if not default_model:
-                    default_model = "microsoft/phi-2"
-                    logger.warning(f"No local model found, defaulting to {default_model}. This will download ~5GB on first use.")
-                
             llm = HuggingFaceProvider(
                 model_id=config.get("model_id", default_model),
                 device=config.get("device"),
@@ -100,7 +120,7 @@ class SVAgentChat(ChatInterface):
         super().__init__(sv_agent, llm)
         
         # SV-specific attributes
-        self.knowledge = SVKnowledgeBase()
+        self.knowledge = get_shared_knowledge_base()
         self.context = {
             "current_module": None,
             "workflow_state": None,
@@ -118,6 +138,10 @@ class SVAgentChat(ChatInterface):
         from .sb_executor import SevenBridgesExecutor
         self.sb_executor = SevenBridgesExecutor(self.agent)
         
+        # The knowledge context is a pure function of the query; repeated
+        # questions reuse it instead of searching the knowledge base again
+        self._get_relevant_knowledge = functools.lru_cache(maxsize=256)(self._get_relevant_knowledge)
+        
         # Multi-step execution state
         self.execution_state = {
             "mode": None,  # "local", "sb" 
@@ -126,10 +150,45 @@ class SVAgentChat(ChatInterface):
             "awaiting_response": None
         }
         
+        # Event loop for async LLM providers, created on first use and
+        # reused across turns so provider connections survive between them
+        self._loop = None
+        
     def chat(self, query: str) -> str:
         """Compatibility method that forwards to process_query."""
         return self.process_query(query)
     
+    def reset(self) -> None:
+        """Start a new conversation, keeping the loaded model.
+        
+        Forgets the conversation memory and abandons any pending Seven
+        Bridges dialog, so the next query is not taken as its answer.
+        """
+        self.memory.history.clear()
+        self.execution_state = {
+            "mode": None,
+            "plan": None,
+            "step": 0,
+            "awaiting_response": None
+        }
+    
+    def close(self) -> None:
+        """Close the event loop used for async LLM providers."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+        self._loop = None
+    
+    def __del__(self):
+        # Instances that failed part-way through __init__ have no loop
+        if getattr(self, "_loop", None) is not None:
+            self.close()
+    
+    def _run_async(self, coro):
+        """Run a coroutine to completion on this chat's event loop."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
     def process_query(self, query: str) -> str:
         """Override to handle multi-step execution dialogs."""
         # Check if we're in the middle of a multi-step execution
@@ -138,11 +197,8 @@ class SVAgentChat(ChatInterface):
         
         # Check for Seven Bridges execution requests
         query_lower = query.lower()
-        sb_keywords = ["seven bridges", "sb", "cgc", "cavatica", "platform", "cloud"]
-        execution_keywords = ["run", "execute", "process"]
-        
-        if (any(sb in query_lower for sb in sb_keywords) and 
-            any(exec in query_lower for exec in execution_keywords)):
+        if (any(sb in query_lower for sb in _SB_KEYWORDS) and
+            any(word in query_lower for word in _EXECUTION_KEYWORDS)):
             return self._initiate_sb_execution(query)
         
         # Otherwise, use the parent implementation
@@ -302,7 +358,7 @@ class SVAgentChat(ChatInterface):
         try:
             # Generate response
             if asyncio.iscoroutinefunction(self.llm.generate):
-                response = asyncio.run(self.llm.generate(prompt))
+                response = self._run_async(self.llm.generate(prompt))
             else:
                 response = self.llm.generate(prompt)
             
@@ -354,27 +410,12 @@ class SVAgentChat(ChatInterface):
         query_lower = query.lower()
         
         # For general questions like "what is X", use the LLM
-        if query_lower.startswith(("what is", "what are", "how do", "why", "when", "who", "define", "explain what")):
+        if query_lower.startswith(_GENERAL_QUESTION_PREFIXES):
             return "general"
         
-        # Check for specific command-like intents
-        if "explain module" in query_lower or "describe module" in query_lower:
-            return "explain"
-        elif any(word in query_lower for word in ["convert", "transform"]):
-            return "convert" 
-        elif any(word in query_lower for word in ["analyze", "analysis"]):
-            return "analyze"
-        elif any(word in query_lower for word in ["run", "execute"]):
-            return "run"
-        elif any(word in query_lower for word in ["recommend", "best practice", "should i"]):
-            return "recommend"
-        elif any(word in query_lower for word in ["error", "failed", "problem", "troubleshoot"]):
-            return "troubleshoot"
-        elif any(word in query_lower for word in ["help", "what can you"]):
-            return "help"
-        
-        # Default to general LLM handling for open-ended questions
-        return "general"
+        # Check for specific command-like intents, defaulting to general
+        # LLM handling for open-ended questions
+        return first_matching_tier(query_lower, _INTENT_KEYWORDS) or "general"
     
     def _handle_sv_help(self, query: str) -> str:
         """Handle SV-specific help requests."""
@@ -0,0 +1,125 @@
+"""Warm daemon for SV-Agent - keeps one chat session loaded across `ask` calls."""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def default_socket_path() -> Path:
+    """Get the Unix socket path shared by the daemon and `ask` clients.
+
+    Uses ``SV_AGENT_SOCKET`` if set, otherwise ``sv-agent.sock`` under the
+    per-user ``XDG_RUNTIME_DIR``. Without one it falls back to the shared
+    system temp directory, with the uid in the name so users don't collide.
+    """
+    if os.environ.get("SV_AGENT_SOCKET"):
+        return Path(os.environ["SV_AGENT_SOCKET"])
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(os.environ["XDG_RUNTIME_DIR"]) / "sv-agent.sock"
+    return Path(tempfile.gettempdir()) / f"sv-agent-{os.getuid()}.sock"
+
+
+class _ChatRequestHandler(socketserver.StreamRequestHandler):
+    """Answer newline-delimited JSON questions with the daemon's chat session."""
+
+    def handle(self):
+        chat = self.server.chat
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                # Each question is a one-shot ask: no memory or pending
+                # dialog carries over from earlier ones
+                chat.reset()
+                reply = {"response": chat.chat(request["question"])}
+            except Exception as e:
+                logger.error("Daemon request failed: %s", e)
+                reply = {"error": str(e)}
+
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class SVAgentDaemon(socketserver.UnixStreamServer):
+    """Unix socket server holding a single warm SVAgentChat instance.
+
+    Requests are served one at a time, so the chat session is never used
+    concurrently. The session is reset before each question; only the
+    loaded model is kept warm between them.
+    """
+
+    def __init__(self, chat, socket_path: Optional[Path] = None):
+        """Bind the daemon socket, replacing a stale socket file if present."""
+        self.chat = chat
+        self.socket_path = Path(socket_path or default_socket_path())
+
+        if self.socket_path.exists():
+            if ask_daemon("", self.socket_path, probe=True) is not None:
+                raise RuntimeError(f"sv-agent daemon already running on {self.socket_path}")
+            self.socket_path.unlink()
+
+        super().__init__(str(self.socket_path), _ChatRequestHandler)
+        # Only the owner may connect
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self):
+        """Close the server and remove its socket file."""
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def ask_daemon(question: str,
+               socket_path: Optional[Path] = None,
+               probe: bool = False) -> Optional[str]:
+    """Ask a question through a running daemon.
+
+    Args:
+        question: Question to forward to the daemon's chat session
+        socket_path: Daemon socket (default: ``default_socket_path()``)
+        probe: Only check that a daemon is listening; nothing is sent
+
+    Returns:
+        The daemon's response (empty string when probing), or None if no
+        daemon is reachable or its socket belongs to another user
+    """
+    path = Path(socket_path or default_socket_path())
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    try:
+        owner = path.stat().st_uid
+    except OSError:
+        return None
+    if owner != os.getuid():
+        # Another user's socket could serve forged answers
+        logger.warning("Ignoring %s: owned by uid %d, not the current user", path, owner)
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1.0)
+            sock.connect(str(path))
+            if probe:
+                return ""
+
+            # Generation can take a while; only the connect is time-limited
+            sock.settimeout(None)
+            sock.sendall(json.dumps({"question": question}).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+
+    if not line:
+        return None
+
+    reply = json.loads(line)
+    if "error" in reply:
+        raise RuntimeError(reply["error"])
+    return reply["response"]
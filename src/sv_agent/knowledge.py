@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Any, Optional
 from pathlib import Path
+import functools
 import json
 
 
@@ -297,4 +298,14 @@ It integrates evidence from:
 - Discordant read pairs
 - Read depth
 - Local assembly
-"""
\ No newline at end of file
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def get_shared_knowledge_base() -> SVKnowledgeBase:
+    """Get the knowledge base shared by the agent and its interfaces.
+    
+    The knowledge base is read-only once built, so one instance per process
+    serves SVAgent, SVAgentChat, the notebook and the NL executor.
+    """
+    return SVKnowledgeBase()
@@ -1,38 +1,272 @@
 """CLI entry point for SVAgent."""
 
 import argparse
+import functools
 import json
 import sys
 import logging
+import os
+import socket
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-from sv_agent import SVAgent
-from sv_agent.chat import SVAgentChat
+if TYPE_CHECKING:
+    # Imported lazily at runtime (see _make_agent): the agent stack pulls in
+    # awlkit and, for chat, the model libraries
+    from sv_agent import SVAgent
+
+
+logger = logging.getLogger(__name__)
+
+_EPILOG = """
+Examples:
+  sv-agent convert -i gatk-sv/wdl -o src/sv_agent/cwl
+  sv-agent convert -i gatk-sv/wdl -o src/sv_agent/cwl -m GatherSampleEvidence
+  sv-agent chat
+  sv-agent chat --model /path/to/local/model
+  sv-agent ask "What coverage do I need for SV detection?"
+  sv-agent daemon
+  sv-agent analyze GATKSVPipelineBatch
+        """
+
+# Argument choices
+_DEVICES = ('cuda', 'cpu', 'auto')
+_FORMATS = ('json', 'text')
+_RUNTIMES = ('docker', 'podman', 'singularity', 'none')
+_ENGINES = ('auto', 'cwltool', 'sevenbridges')
+
+_EXIT_COMMANDS = frozenset({'exit', 'quit', 'bye'})
+
+_CHAT_BANNER = (
+    "🧬 SV-Agent Interactive Chat\n"
+    + "=" * 50 + "\n"
+    "Mode: {mode}\n"
+    "{detail}\n"
+    "Ask me about GATK-SV, structural variants, or workflow conversion.\n"
+    "Type 'help' for guidance or 'exit' to quit.\n\n"
+)
+
+_ANALYSIS_TEMPLATE = """
+Workflow Analysis: {name}
+==================================================
+Inputs:       {inputs}
+Outputs:      {outputs}
+Tasks:        {tasks}
+Calls:        {calls}
+Imports:      {import_count}
+
+Statistics:
+  Max parallelism:  {max_parallelism}
+  Has cycles:       {has_cycles}
+  Total calls:      {total_calls}
+"""
+
+
+class _JoinAction(argparse.Action):
+    """Store a multi-word positional as a single space-joined string."""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, " ".join(values))
+
+
+# Global options that consume the following token as their value, and
+# those that take none
+_GLOBAL_VALUE_OPTIONS = frozenset({
+    '--model', '--api-token', '--device', '--auth-token', '--cache-dir'
+})
+_GLOBAL_FLAG_OPTIONS = frozenset({
+    '-v', '--verbose', '--use-api', '--kb-only', '--load-in-8bit', '--load-in-4bit'
+})
+
+# Subcommand table: name -> help text and (flags, add_argument kwargs) pairs
+_COMMANDS = {
+    # Convert command - main functionality
+    "convert": {
+        "help": "Convert GATK-SV WDL workflows to CWL format",
+        "args": [
+            (('-i', '--input'), {
+                "type": Path,
+                "default": Path("gatk-sv/wdl"),
+                "help": "Input directory containing WDL files (default: gatk-sv/wdl)"
+            }),
+            (('-o', '--output'), {
+                "type": Path,
+                "default": Path("src/sv_agent/cwl"),
+                "help": "Output directory for CWL files (default: src/sv_agent/cwl)"
+            }),
+            (('-m', '--modules'), {
+                "nargs": "+",
+                "help": "Specific modules to convert (e.g., GatherSampleEvidence)"
+            }),
+            (('--validate',), {
+                "action": "store_true",
+                "help": "Validate generated CWL files"
+            }),
+        ]
+    },
+    "analyze": {
+        "help": "Analyze GATK-SV workflow structure",
+        "args": [
+            (("workflow",), {
+                "help": "Workflow name to analyze (without .wdl extension)"
+            }),
+            (('-f', '--format'), {
+                "choices": _FORMATS,
+                "default": 'text',
+                "help": "Output format (default: text)"
+            }),
+        ]
+    },
+    "chat": {
+        "help": "Interactive chat for SV analysis guidance",
+        "args": [
+            (('--no-banner',), {
+                "action": "store_true",
+                "help": "Skip welcome banner"
+            }),
+        ]
+    },
+    "ask": {
+        "help": "Ask a single question about SV analysis",
+        "args": [
+            (("question",), {
+                "action": _JoinAction,
+                "nargs": "+",
+                "help": "Your question"
+            }),
+            (('--no-daemon',), {
+                "action": "store_true",
+                "help": "Don't forward the question to a running 'sv-agent daemon'"
+            }),
+        ]
+    },
+    # Daemon command - keep a chat session warm for ask
+    "daemon": {
+        "help": "Serve 'ask' questions from a warm chat session over a Unix socket",
+        "args": []
+    },
+    "list": {
+        "help": "List available GATK-SV modules",
+        "args": [
+            (('--details',), {
+                "action": "store_true",
+                "help": "Show detailed information"
+            }),
+        ]
+    },
+    # Run command - execute CWL workflows
+    "run": {
+        "help": "Execute a CWL workflow",
+        "args": [
+            (("workflow",), {
+                "type": Path,
+                "help": "Path to CWL workflow file"
+            }),
+            (("inputs",), {
+                "type": Path,
+                "help": "Path to inputs YAML/JSON file"
+            }),
+            (('-o', '--output-dir'), {
+                "type": Path,
+                "help": "Output directory (default: current directory)"
+            }),
+            (('--runtime',), {
+                "choices": _RUNTIMES,
+                "default": 'docker',
+                "help": "Container runtime for cwltool; 'none' runs without containers (default: docker)"
+            }),
+            (('--engine',), {
+                "choices": _ENGINES,
+                "default": 'auto',
+                "help": "Execution engine to use (default: auto)"
+            }),
+            (('--sb-project',), {
+                "help": "Seven Bridges project ID (for sevenbridges engine)"
+            }),
+            (('--no-validate',), {
+                "action": "store_true",
+                "help": "Skip workflow validation before execution"
+            }),
+            (('--force-validate',), {
+                "action": "store_true",
+                "help": "Validate even if the workflow file is unchanged since it last passed"
+            }),
+        ]
+    },
+}
 
 
 def setup_logging(verbose: bool):
-    """Set up logging configuration."""
+    """Set up logging configuration.
+    
+    If the host process already configured logging, only the level is
+    adjusted so its handlers and format are left alone.
+    """
     level = logging.DEBUG if verbose else logging.INFO
+    root = logging.getLogger()
+    if root.handlers:
+        root.setLevel(level)
+        return
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
 
-def main():
-    """Main CLI entry point."""
+def _selected_command(argv: List[str]) -> Optional[str]:
+    """Find the subcommand named in ``argv`` without fully parsing it.
+
+    Any option before the command that isn't spelled exactly as a known
+    global option (``-h``, abbreviations such as ``--mod``, typos) gives
+    None, so argparse sees the full parser for help and errors.
+
+    Returns:
+        The first non-option token if it names a known command, else None
+    """
+    tokens = iter(argv)
+    for token in tokens:
+        if token == '--':
+            break
+        if token.startswith('-'):
+            if token in _GLOBAL_VALUE_OPTIONS:
+                next(tokens, None)
+            elif token not in _GLOBAL_FLAG_OPTIONS and token.partition('=')[0] not in _GLOBAL_VALUE_OPTIONS:
+                return None
+            continue
+        return token if token in _COMMANDS else None
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _default_model() -> str:
+    """Resolve the model used when ``--model`` is not given.
+
+    Only commands that load a model call this, so ``--help``, ``list`` and
+    friends never touch the ``models/`` directory.
+    """
+    # Check for local Gemma model
+    if Path('models/gemma-latest').exists():
+        return 'models/gemma-latest'
+    if Path('models/default_model.txt').exists():
+        return Path('models/default_model.txt').read_text().strip()
+    return 'microsoft/phi-2'  # Non-gated fallback model
+
+
+@functools.lru_cache(maxsize=None)
+def _get_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI argument parser.
+
+    Only the subparser for ``command`` is registered; with no command (top
+    level help, unknown or missing command) every subparser is built so
+    help and error messages list them all. Parsers are cached so repeated
+    calls to ``main()`` in the same process (tests, embedded use) only pay
+    the construction cost once.
+    """
     parser = argparse.ArgumentParser(
         description="sv-agent - Convert GATK-SV WDL workflows to CWL and provide SV analysis expertise",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  sv-agent convert -i gatk-sv/wdl -o src/sv_agent/cwl
-  sv-agent convert -i gatk-sv/wdl -o src/sv_agent/cwl -m GatherSampleEvidence
-  sv-agent chat
-  sv-agent chat --model /path/to/local/model
-  sv-agent ask "What coverage do I need for SV detection?"
-  sv-agent analyze GATKSVPipelineBatch
-        """
+        epilog=_EPILOG
     )
     
     parser.add_argument(
@@ -42,17 +276,10 @@ Examples:
     )
     
     # Model configuration options
-    # Check for local Gemma model
-    default_model = 'microsoft/phi-2'  # Non-gated fallback model
-    if Path('models/gemma-latest').exists():
-        default_model = 'models/gemma-latest'
-    elif Path('models/default_model.txt').exists():
-        default_model = Path('models/default_model.txt').read_text().strip()
-    
     parser.add_argument(
         '--model',
-        default=default_model,
-        help=f'Model path - can be HuggingFace ID or local directory path (default: {default_model})'
+        help='Model path - can be HuggingFace ID or local directory path '
+             '(default: models/gemma-latest if present, else microsoft/phi-2)'
     )
     parser.add_argument(
         '--use-api',
@@ -70,7 +297,7 @@ Examples:
     )
     parser.add_argument(
         '--device',
-        choices=['cuda', 'cpu', 'auto'],
+        choices=_DEVICES,
         default='auto',
         help='Device for model inference (default: auto)'
     )
@@ -95,131 +322,393 @@ Examples:
     
     # Create subcommands
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for name, spec in _COMMANDS.items():
+        if command is not None and name != command:
+            continue
+        command_parser = subparsers.add_parser(name, help=spec["help"])
+        for flags, options in spec["args"]:
+            command_parser.add_argument(*flags, **options)
     
-    # Convert command - main functionality
-    convert_parser = subparsers.add_parser(
-        "convert",
-        help="Convert GATK-SV WDL workflows to CWL format"
-    )
-    convert_parser.add_argument(
-        '-i', '--input',
-        type=Path,
-        default=Path("gatk-sv/wdl"),
-        help="Input directory containing WDL files (default: gatk-sv/wdl)"
-    )
-    convert_parser.add_argument(
-        '-o', '--output',
-        type=Path,
-        default=Path("src/sv_agent/cwl"),
-        help="Output directory for CWL files (default: src/sv_agent/cwl)"
-    )
-    convert_parser.add_argument(
-        '-m', '--modules',
-        nargs="+",
-        help="Specific modules to convert (e.g., GatherSampleEvidence)"
-    )
-    convert_parser.add_argument(
-        '--validate',
-        action='store_true',
-        help='Validate generated CWL files'
-    )
+    return parser
+
+
+def _validation_cache_file() -> Path:
+    """Get the file recording workflows that passed validation."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "sv-agent" / "validated.json"
+
+
+def _validation_stamp(workflow: Path) -> Tuple[str, List[int]]:
+    """Get the cache key (resolved path) and stamp (mtime, size) for a workflow."""
+    stat = workflow.stat()
+    return str(workflow.resolve()), [stat.st_mtime_ns, stat.st_size]
+
+
+def _load_validation_cache() -> Dict[str, List[int]]:
+    """Load the validation cache, treating a missing or corrupt file as empty."""
+    try:
+        data = json.loads(_validation_cache_file().read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _is_validation_cached(workflow: Path) -> bool:
+    """Check if the workflow passed validation and is unchanged since."""
+    try:
+        key, stamp = _validation_stamp(workflow)
+    except OSError:
+        return False
+    return _load_validation_cache().get(key) == stamp
+
+
+def _record_validation(workflow: Path) -> None:
+    """Record that the workflow passed validation in its current state."""
+    cache = _load_validation_cache()
+    try:
+        key, stamp = _validation_stamp(workflow)
+        cache[key] = stamp
+        cache_file = _validation_cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(cache))
+    except OSError as e:
+        logger.debug("Could not update validation cache: %s", e)
+
+
+def _make_llm_config(args: argparse.Namespace) -> Dict[str, Any]:
+    """Build the SVAgentChat LLM configuration from the global options.
     
-    # Analyze command
-    analyze_parser = subparsers.add_parser(
-        "analyze",
-        help="Analyze GATK-SV workflow structure"
-    )
-    analyze_parser.add_argument(
-        "workflow",
-        help="Workflow name to analyze (without .wdl extension)"
-    )
-    analyze_parser.add_argument(
-        '-f', '--format',
-        choices=['json', 'text'],
-        default='text',
-        help='Output format (default: text)'
-    )
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        ``{"kb_only": True}`` in knowledge-base-only mode, otherwise the
+        model loading options
+    """
+    if args.kb_only:
+        # No LLM: skip the model options entirely
+        return {"kb_only": True}
+    return {
+        "model_id": args.model or _default_model(),
+        "use_api": args.use_api,
+        "api_token": args.api_token,
+        "device": args.device if args.device != 'auto' else None,
+        "load_in_8bit": args.load_in_8bit,
+        "load_in_4bit": args.load_in_4bit,
+        "auth_token": args.auth_token,
+        "cache_dir": args.cache_dir
+    }
+
+
+def _make_chat_reader() -> Callable[[], str]:
+    """Return a line reader for the chat loop.
     
-    # Chat command
-    chat_parser = subparsers.add_parser(
-        "chat",
-        help="Interactive chat for SV analysis guidance"
-    )
-    chat_parser.add_argument(
-        '--no-banner',
-        action="store_true",
-        help="Skip welcome banner"
-    )
+    Interactive terminals get ``input()`` with readline line editing; piped
+    or scripted stdin is read directly so readline is never involved. Both
+    paths show the same ``You: `` prompt.
+    """
+    if not sys.stdin.isatty():
+        def read() -> str:
+            sys.stdout.write("You: ")
+            sys.stdout.flush()
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError
+            return line.rstrip("\n")
+        return read
     
-    # Ask command
-    ask_parser = subparsers.add_parser(
-        "ask",
-        help="Ask a single question about SV analysis"
-    )
-    ask_parser.add_argument(
-        "question",
-        nargs="+",
-        help="Your question"
-    )
+    try:
+        import readline  # noqa: F401 - enables line editing for input()
+    except ImportError:
+        pass  # Not available on Windows; input() still works without it
+    return lambda: input("You: ")
+
+
+def _make_agent() -> 'SVAgent':
+    """Create the SVAgent for commands that need one.
     
-    # List command
-    list_parser = subparsers.add_parser(
-        "list",
-        help="List available GATK-SV modules"
-    )
-    list_parser.add_argument(
-        '--details',
-        action='store_true',
-        help='Show detailed information'
-    )
+    Called from the individual handlers so commands such as ``list`` never
+    construct (or import) the agent.
+    """
+    from sv_agent import SVAgent
+    return SVAgent()
+
+
+def _handle_convert(args: argparse.Namespace) -> None:
+    """Convert GATK-SV WDL workflows to CWL and print a summary."""
+    agent = _make_agent()
+    logger.info("Converting WDL files from %s to %s", args.input, args.output)
     
-    # Run command - execute CWL workflows
-    run_parser = subparsers.add_parser(
-        "run",
-        help="Execute a CWL workflow"
-    )
-    run_parser.add_argument(
-        "workflow",
-        type=Path,
-        help="Path to CWL workflow file"
+    results = agent.convert_gatksv_to_cwl(
+        output_dir=args.output,
+        modules=args.modules
     )
-    run_parser.add_argument(
-        "inputs",
-        type=Path,
-        help="Path to inputs YAML/JSON file"
-    )
-    run_parser.add_argument(
-        '-o', '--output-dir',
-        type=Path,
-        help="Output directory (default: current directory)"
-    )
-    run_parser.add_argument(
-        '--no-container',
-        action='store_true',
-        help='Run without container (Docker/Singularity)'
-    )
-    run_parser.add_argument(
-        '--singularity',
-        action='store_true',
-        help='Use Singularity instead of Docker'
-    )
-    run_parser.add_argument(
-        '--podman',
-        action='store_true',
-        help='Use Podman instead of Docker'
-    )
-    run_parser.add_argument(
-        '--engine',
-        choices=['auto', 'cwltool', 'sevenbridges'],
-        default='auto',
-        help='Execution engine to use (default: auto)'
+    
+    converted = results['converted']
+    failed = results['failed']
+    n_converted = len(converted)
+    out = [
+        "",
+        "Conversion Summary:",
+        f"  ✓ Converted: {n_converted} files",
+    ]
+    
+    if converted:
+        out.append("\nSuccessfully converted:")
+        out.extend(f"  - {f}" for f in islice(converted, 10))  # Show first 10
+        if n_converted > 10:
+            out.append(f"  ... and {n_converted - 10} more")
+    
+    if failed:
+        out.append(f"\n  ✗ Failed: {len(failed)} files")
+        out.extend(
+            f"  - {failure['file']}: {failure['error']}"
+            for failure in islice(failed, 5)
+        )
+    
+    out.append(f"\nOutput directory: {args.output}")
+    
+    if args.validate:
+        out.append("\nValidation: Run 'cwltool --validate <cwl_file>' to validate outputs")
+    
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _handle_analyze(args: argparse.Namespace) -> None:
+    """Analyze a GATK-SV workflow structure."""
+    agent = _make_agent()
+    analysis = agent.analyze_gatksv_workflow(args.workflow)
+    
+    if args.format == 'json':
+        # Serialize once and emit with a single write
+        sys.stdout.write(json.dumps(analysis, indent=2) + "\n")
+    else:
+        sys.stdout.write(_ANALYSIS_TEMPLATE.format_map({
+            **analysis,
+            **analysis['statistics'],
+            'import_count': len(analysis['imports'])
+        }))
+
+
+def _handle_list(args: argparse.Namespace) -> None:
+    """List available GATK-SV modules."""
+    from sv_agent.knowledge import SVKnowledgeBase
+    kb = SVKnowledgeBase()
+    
+    if args.details:
+        lines = (
+            f"\n{module_id}: {info['name']}\n  Purpose: {info['purpose']}"
+            for module_id, info in kb.modules.items()
+        )
+    else:
+        lines = (
+            f"  {module_id:<12} - {info['name']}"
+            for module_id, info in kb.modules.items()
+        )
+    
+    sys.stdout.write("\nAvailable GATK-SV Modules:\n" + "=" * 60 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _handle_chat(args: argparse.Namespace) -> None:
+    """Run the interactive chat loop."""
+    from sv_agent.chat import SVAgentChat
+    chat = SVAgentChat(_make_agent(), llm_config=_make_llm_config(args))
+    
+    if not args.no_banner:
+        if args.kb_only:
+            mode = "Knowledge Base Only (no LLM)"
+            detail = "Features: Fast responses, module info, structured knowledge"
+        elif args.use_api:
+            mode = "API"
+            detail = f"Model: {args.model or 'mistralai/Mixtral-8x7B-Instruct-v0.1'}"
+        else:
+            mode = "Local Model"
+            detail = f"Model: {args.model or _default_model()}"
+        sys.stdout.write(_CHAT_BANNER.format_map({"mode": mode, "detail": detail}))
+        sys.stdout.flush()
+    
+    read_input = _make_chat_reader()
+    while True:
+        try:
+            user_input = read_input()
+            command = user_input.strip()
+            # Exit words are at most 4 characters; skip lower() for real questions
+            if len(command) <= 4 and command.lower() in _EXIT_COMMANDS:
+                print("SV-Agent: Goodbye! Happy SV hunting! 🧬")
+                break
+    
+            response = chat.chat(user_input)
+            print(f"\nSV-Agent: {response}\n")
+    
+        except (KeyboardInterrupt, EOFError):
+            print("\nSV-Agent: Goodbye!")
+            break
+        except Exception as e:
+            logger.error("Chat error: %s", e)
+            logger.debug("Chat error traceback", exc_info=True)
+            print(f"\nSV-Agent: Sorry, I encountered an error: {e}\n")
+
+
+def _has_model_options(args: argparse.Namespace) -> bool:
+    """Check if any global option that configures the chat model was given."""
+    return bool(
+        args.kb_only or args.model or args.use_api or args.api_token
+        or args.device != 'auto' or args.load_in_8bit or args.load_in_4bit
+        or args.auth_token or args.cache_dir
     )
-    run_parser.add_argument(
-        '--sb-project',
-        help='Seven Bridges project ID (for sevenbridges engine)'
+
+
+def _handle_ask(args: argparse.Namespace) -> None:
+    """Answer a single question."""
+    # Answer from a warm daemon when one is running. The daemon keeps the
+    # model options it was started with, so asks that set their own skip it.
+    if not args.no_daemon and not _has_model_options(args) and hasattr(socket, "AF_UNIX"):
+        from sv_agent.daemon import ask_daemon
+        response = ask_daemon(args.question)
+        if response is not None:
+            print(response)
+            return
+    
+    from sv_agent.chat import SVAgentChat
+    chat = SVAgentChat(_make_agent(), llm_config=_make_llm_config(args))
+    response = chat.chat(args.question)
+    print(response)
+
+
+def _handle_daemon(args: argparse.Namespace) -> None:
+    """Serve ask questions from a warm chat session."""
+    from sv_agent.chat import SVAgentChat
+    from sv_agent.daemon import SVAgentDaemon
+    
+    chat = SVAgentChat(_make_agent(), llm_config=_make_llm_config(args))
+    server = SVAgentDaemon(chat)
+    print(f"SV-Agent daemon listening on {server.socket_path} (Ctrl-C to stop)")
+    
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nSV-Agent daemon stopped.")
+    finally:
+        server.server_close()
+
+
+def _handle_run(args: argparse.Namespace) -> None:
+    """Execute a CWL workflow."""
+    sys.stdout.write(f"\n🚀 Executing workflow: {args.workflow.name}\n{'=' * 50}\n")
+    
+    # Configure execution engine
+    if args.engine == 'sevenbridges' and not args.sb_project:
+        print("Error: --sb-project is required for Seven Bridges engine", file=sys.stderr)
+        sys.exit(1)
+    
+    execution_config = {'preferred_engine': args.engine}
+    if args.engine != 'sevenbridges':
+        execution_config['cwltool_config'] = {
+            'no_container': args.runtime == 'none',
+            'singularity': args.runtime == 'singularity',
+            'podman': args.runtime == 'podman'
+        }
+    if args.sb_project:
+        execution_config['sevenbridges_config'] = {
+            'project': args.sb_project
+        }
+    
+    # Update agent configuration
+    agent = _make_agent()
+    agent.config['execution'] = execution_config
+    agent._setup_execution_engine()
+    
+    # Check engine availability
+    if not agent.execution_engine.is_available():
+        sys.stderr.write(
+            "\n❌ No execution engine available!\n"
+            "\nTo execute workflows, you need one of:\n"
+            "  - cwltool: pip install cwltool\n"
+            "  - Seven Bridges CLI: https://docs.sevenbridges.com/docs/cli-overview\n"
+        )
+        sys.exit(1)
+    
+    # Show engine info
+    engine_info = agent.execution_engine.get_engine_info()
+    print(f"Using engine: {engine_info.get('selected_engine', 'Unknown')}")
+    
+    # Validate workflow
+    if args.no_validate:
+        print("\nSkipping workflow validation (--no-validate)")
+    elif not args.force_validate and _is_validation_cached(args.workflow):
+        print("\n✓ Workflow validation cached (file unchanged since last pass)")
+    else:
+        print(f"\nValidating workflow...")
+        if agent.validate_workflow(args.workflow):
+            print("✓ Workflow validation passed")
+            _record_validation(args.workflow)
+        else:
+            print("✗ Workflow validation failed", file=sys.stderr)
+            sys.exit(1)
+    
+    # Execute workflow
+    out = ["\nExecuting workflow...", f"  Inputs: {args.inputs}"]
+    if args.output_dir:
+        out.append(f"  Output: {args.output_dir}")
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+    
+    result = agent.execute_workflow(
+        args.workflow,
+        args.inputs,
+        args.output_dir
     )
     
-    args = parser.parse_args()
+    # Display results
+    out = [
+        f"\n{'='*50}",
+        f"Execution Status: {result.status.value}",
+    ]
+    
+    if result.success:
+        out.append("\n✅ Workflow executed successfully!")
+        if result.outputs:
+            out.append("\nOutputs:")
+            for key, value in result.outputs.items():
+                out.append(f"  {key}: {value}")
+        if result.duration_seconds:
+            out.append(f"\nDuration: {result.duration_seconds:.1f} seconds")
+    else:
+        out.append("\n❌ Workflow execution failed!")
+        if result.errors:
+            out.append("\nErrors:")
+            for error in result.errors:
+                out.append(f"  - {error}")
+    
+    if result.execution_id:
+        out.append(f"\nExecution ID: {result.execution_id}")
+    
+    if result.logs and args.verbose:
+        out.append("\nExecution logs:")
+        out.append("-" * 50)
+        out.append(result.logs)
+    
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+_COMMAND_HANDLERS = {
+    "convert": _handle_convert,
+    "analyze": _handle_analyze,
+    "list": _handle_list,
+    "chat": _handle_chat,
+    "ask": _handle_ask,
+    "daemon": _handle_daemon,
+    "run": _handle_run,
+}
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _get_parser(_selected_command(argv))
+    args = parser.parse_args(argv)
     
     # Show help if no command
     if not args.command:
@@ -228,252 +717,12 @@ Examples:
     
     # Set up logging
     setup_logging(args.verbose)
-    logger = logging.getLogger(__name__)
-    
-    # Initialize agent
-    agent = SVAgent()
     
     try:
-        if args.command == "convert":
-            # Main conversion functionality
-            logger.info(f"Converting WDL files from {args.input} to {args.output}")
-            
-            results = agent.convert_gatksv_to_cwl(
-                output_dir=args.output,
-                modules=args.modules
-            )
-            
-            print(f"\nConversion Summary:")
-            print(f"  ✓ Converted: {len(results['converted'])} files")
-            
-            if results['converted']:
-                print("\nSuccessfully converted:")
-                for f in results['converted'][:10]:  # Show first 10
-                    print(f"  - {f}")
-                if len(results['converted']) > 10:
-                    print(f"  ... and {len(results['converted']) - 10} more")
-            
-            if results['failed']:
-                print(f"\n  ✗ Failed: {len(results['failed'])} files")
-                for failure in results['failed'][:5]:
-                    print(f"  - {failure['file']}: {failure['error']}")
-            
-            print(f"\nOutput directory: {args.output}")
-            
-            if args.validate:
-                print("\nValidation: Run 'cwltool --validate <cwl_file>' to validate outputs")
-        
-        elif args.command == "analyze":
-            # Analyze workflow
-            analysis = agent.analyze_gatksv_workflow(args.workflow)
-            
-            if args.format == 'json':
-                print(json.dumps(analysis, indent=2))
-            else:
-                print(f"\nWorkflow Analysis: {analysis['name']}")
-                print(f"{'=' * 50}")
-                print(f"Inputs:       {analysis['inputs']}")
-                print(f"Outputs:      {analysis['outputs']}")
-                print(f"Tasks:        {analysis['tasks']}")
-                print(f"Calls:        {analysis['calls']}")
-                print(f"Imports:      {len(analysis['imports'])}")
-                
-                stats = analysis['statistics']
-                print(f"\nStatistics:")
-                print(f"  Max parallelism:  {stats['max_parallelism']}")
-                print(f"  Has cycles:       {stats['has_cycles']}")
-                print(f"  Total calls:      {stats['total_calls']}")
-        
-        elif args.command == "list":
-            # List available modules
-            from sv_agent.knowledge import SVKnowledgeBase
-            kb = SVKnowledgeBase()
-            
-            print("\nAvailable GATK-SV Modules:")
-            print("=" * 60)
-            
-            for module_id, info in kb.modules.items():
-                if args.details:
-                    print(f"\n{module_id}: {info['name']}")
-                    print(f"  Purpose: {info['purpose']}")
-                else:
-                    print(f"  {module_id:<12} - {info['name']}")
-        
-        elif args.command == "chat":
-            # Configure LLM
-            llm_config = {
-                "model_id": args.model,
-                "use_api": args.use_api,
-                "api_token": args.api_token,
-                "kb_only": args.kb_only,
-                "device": args.device if args.device != 'auto' else None,
-                "load_in_8bit": args.load_in_8bit,
-                "load_in_4bit": args.load_in_4bit,
-                "auth_token": args.auth_token,
-                "cache_dir": args.cache_dir
-            }
-            
-            # Interactive chat
-            chat = SVAgentChat(agent, llm_config=llm_config)
-            
-            if not args.no_banner:
-                print("🧬 SV-Agent Interactive Chat")
-                print("=" * 50)
-                if args.kb_only:
-                    print("Mode: Knowledge Base Only (no LLM)")
-                    print("Features: Fast responses, module info, structured knowledge")
-                elif args.use_api:
-                    print(f"Mode: API")
-                    print(f"Model: {args.model if args.model != default_model else 'mistralai/Mixtral-8x7B-Instruct-v0.1'}")
-                else:
-                    print(f"Mode: Local Model")
-                    print(f"Model: {args.model}")
-                print("Ask me about GATK-SV, structural variants, or workflow conversion.")
-                print("Type 'help' for guidance or 'exit' to quit.\n")
-            
-            while True:
-                try:
-                    user_input = input("You: ")
-                    if user_input.lower() in ['exit', 'quit', 'bye']:
-                        print("SV-Agent: Goodbye! Happy SV hunting! 🧬")
-                        break
-                    
-                    response = chat.chat(user_input)
-                    print(f"\nSV-Agent: {response}\n")
-                
-                except KeyboardInterrupt:
-                    print("\nSV-Agent: Goodbye!")
-                    break
-                except Exception as e:
-                    logger.error(f"Chat error: {e}")
-                    print(f"\nSV-Agent: Sorry, I encountered an error: {e}\n")
-        
-        elif args.command == "ask":
-            # Configure LLM
-            llm_config = {
-                "model_id": args.model,
-                "use_api": args.use_api,
-                "api_token": args.api_token,
-                "kb_only": args.kb_only,
-                "device": args.device if args.device != 'auto' else None,
-                "load_in_8bit": args.load_in_8bit,
-                "load_in_4bit": args.load_in_4bit,
-                "auth_token": args.auth_token,
-                "cache_dir": args.cache_dir
-            }
-            
-            # Single question
-            chat = SVAgentChat(agent, llm_config=llm_config)
-            question = " ".join(args.question)
-            response = chat.chat(question)
-            print(response)
-        
-        elif args.command == "run":
-            # Execute CWL workflow
-            print(f"\n🚀 Executing workflow: {args.workflow.name}")
-            print("=" * 50)
-            
-            # Configure execution engine
-            execution_config = {}
-            
-            if args.engine == 'sevenbridges':
-                if not args.sb_project:
-                    print("Error: --sb-project is required for Seven Bridges engine", file=sys.stderr)
-                    sys.exit(1)
-                execution_config = {
-                    'preferred_engine': 'sevenbridges',
-                    'sevenbridges_config': {
-                        'project': args.sb_project
-                    }
-                }
-            elif args.engine == 'cwltool':
-                execution_config = {
-                    'preferred_engine': 'cwltool',
-                    'cwltool_config': {
-                        'no_container': args.no_container,
-                        'singularity': args.singularity,
-                        'podman': args.podman
-                    }
-                }
-            else:
-                # Auto mode
-                execution_config = {
-                    'preferred_engine': 'auto',
-                    'cwltool_config': {
-                        'no_container': args.no_container,
-                        'singularity': args.singularity,
-                        'podman': args.podman
-                    },
-                    'sevenbridges_config': {
-                        'project': args.sb_project
-                    } if args.sb_project else {}
-                }
-            
-            # Update agent configuration
-            agent.config['execution'] = execution_config
-            agent._setup_execution_engine()
-            
-            # Check engine availability
-            if not agent.execution_engine.is_available():
-                print("\n❌ No execution engine available!", file=sys.stderr)
-                print("\nTo execute workflows, you need one of:", file=sys.stderr)
-                print("  - cwltool: pip install cwltool", file=sys.stderr)
-                print("  - Seven Bridges CLI: https://docs.sevenbridges.com/docs/cli-overview", file=sys.stderr)
-                sys.exit(1)
-            
-            # Show engine info
-            engine_info = agent.execution_engine.get_engine_info()
-            print(f"Using engine: {engine_info.get('selected_engine', 'Unknown')}")
-            
-            # Validate workflow
-            print(f"\nValidating workflow...")
-            if agent.validate_workflow(args.workflow):
-                print("✓ Workflow validation passed")
-            else:
-                print("✗ Workflow validation failed", file=sys.stderr)
-                sys.exit(1)
-            
-            # Execute workflow
-            print(f"\nExecuting workflow...")
-            print(f"  Inputs: {args.inputs}")
-            if args.output_dir:
-                print(f"  Output: {args.output_dir}")
-            
-            result = agent.execute_workflow(
-                args.workflow,
-                args.inputs,
-                args.output_dir
-            )
-            
-            # Display results
-            print(f"\n{'='*50}")
-            print(f"Execution Status: {result.status.value}")
-            
-            if result.success:
-                print("\n✅ Workflow executed successfully!")
-                if result.outputs:
-                    print("\nOutputs:")
-                    for key, value in result.outputs.items():
-                        print(f"  {key}: {value}")
-                if result.duration_seconds:
-                    print(f"\nDuration: {result.duration_seconds:.1f} seconds")
-            else:
-                print("\n❌ Workflow execution failed!")
-                if result.errors:
-                    print("\nErrors:")
-                    for error in result.errors:
-                        print(f"  - {error}")
-            
-            if result.execution_id:
-                print(f"\nExecution ID: {result.execution_id}")
-            
-            if result.logs and args.verbose:
-                print(f"\nExecution logs:")
-                print("-" * 50)
-                print(result.logs)
-    
+        _COMMAND_HANDLERS[args.command](args)
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
+        logger.debug("Command traceback", exc_info=True)
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -0,0 +1,38 @@
+"""Keyword matching shared by the SV-Agent prompt parsers."""
+
+import functools
+import re
+from typing import Optional, Sequence, Tuple
+
+
+@functools.lru_cache(maxsize=None)
+def _whole_word_re(keyword: str) -> "re.Pattern[str]":
+    """Compile (once) a pattern matching ``keyword`` as a whole word."""
+    return re.compile(rf"\b{re.escape(keyword)}\b")
+
+
+def first_matching_tier(text: str,
+                        tiers: Sequence[Tuple[str, Sequence[str]]],
+                        whole_words: bool = False) -> Optional[str]:
+    """Find the first tier, in priority order, with a keyword in ``text``.
+
+    Keywords are found with plain ``in`` checks, which stop at the first hit
+    and are faster than a combined regex scan over the whole text. By
+    default they match as substrings, so "run" also matches "running".
+
+    Args:
+        text: Text to search, already lowercased by the caller
+        tiers: ``(name, keywords)`` pairs, highest priority first
+        whole_words: Only count keywords that appear as whole words; the
+            word-boundary regex runs only from the first substring hit on
+
+    Returns:
+        Name of the first tier with a matching keyword, or None
+    """
+    for name, keywords in tiers:
+        for keyword in keywords:
+            if keyword not in text:
+                continue
+            if not whole_words or _whole_word_re(keyword).search(text, text.index(keyword)):
+                return name
+    return None
@@ -1,16 +1,67 @@
 """Natural language execution module for sv-agent."""
 
+import functools
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Set, Tuple
 import re
 
 from .agent import SVAgent
-from .knowledge import SVKnowledgeBase
+from .knowledge import get_shared_knowledge_base
+from .matching import first_matching_tier
 
 logger = logging.getLogger(__name__)
 
+# Prompt parsing patterns, compiled once at import
+_MODULE_RE = re.compile(r'module\s*(\d+[a-c]?)')
+_WORKFLOW_RE = re.compile(
+    r'(?P<GatherSampleEvidence>gather\s*sample\s*evidence)|(?P<EvidenceQC>evidence\s*qc)'
+)
+_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+_PATH_RE = re.compile(r'[\w/\-\.]+\.(?:bam|cram|vcf|bed|fasta|fa)(?:\.b?gz)?\b', re.IGNORECASE)
+_TOKEN_RE = re.compile(r'[\w/\-\.]+')
+_OUTPUT_RE = re.compile(r'output\s+(?:to|in|directory)?\s*["\']?([^\s"\']+)', re.IGNORECASE)
+_SAMPLE_RE = re.compile(r'sample\s+(?:name|id)?\s*["\']?(\w+)', re.IGNORECASE)
+
+# Converted CWL workflows, one <module>.cwl per module
+_CWL_DIR = Path("src/sv_agent/cwl")
+
+# Dry-run command templates
+_CONVERT_COMMAND = "sv-agent convert -m {module}"
+_RUN_COMMAND = "sv-agent run src/sv_agent/cwl/{module}.cwl {module}_inputs.yaml"
+
+# Modules sharing an input layout in _prepare_module_inputs
+_SAMPLE_QC_MODULES = frozenset({"Module00a", "GatherSampleEvidence"})
+_EVIDENCE_QC_MODULES = frozenset({"Module00b", "EvidenceQC"})
+
+# Operation keywords in priority order; the first operation with any
+# keyword in the prompt wins
+_OPERATION_KEYWORDS = (
+    ("execute", ("run", "execute", "process", "analyze")),
+    ("validate", ("check", "validate", "verify")),
+    ("convert", ("convert", "transform")),
+)
+
+
+@dataclass
+class ExecutionPlan:
+    """Structured execution plan parsed from a natural language request."""
+    
+    __slots__ = ("module", "operation", "files", "parameters")
+    
+    module: Optional[str]
+    operation: str
+    files: List[str]
+    parameters: Dict[str, Any]
+    
+    @property
+    def inputs(self) -> Dict[str, Any]:
+        """Files and parameters in the ``{"files", "parameters"}`` layout."""
+        return {"files": self.files, "parameters": self.parameters}
+
 
 class NaturalLanguageExecutor:
     """Execute GATK-SV workflows based on natural language prompts."""
@@ -18,7 +69,13 @@ class NaturalLanguageExecutor:
     def __init__(self, agent: SVAgent):
         """Initialize with an SVAgent instance."""
         self.agent = agent
-        self.knowledge = SVKnowledgeBase()
+        self.knowledge = get_shared_knowledge_base()
+        
+        # Modules with a CWL file in _CWL_DIR, listed on first execution
+        self._cwl_manifest: Optional[Set[str]] = None
+        
+        # Dry-run commands keyed by (operation, module)
+        self._command_cache: Dict[Tuple[str, Optional[str]], Tuple[str, ...]] = {}
         
         # Module patterns for common requests
         self.module_patterns = {
@@ -30,8 +87,18 @@ class NaturalLanguageExecutor:
             "genotyping": ["Module04", "GenotypeBatch"],
             "annotation": ["AnnotateVcf"]
         }
+        
+        # All keywords in one alternation so a single scan finds the earliest
+        # mention; longer keywords go first so "batch_qc" wins over "qc"
+        self._module_keyword_re = re.compile("|".join(
+            re.escape(keyword)
+            for keyword in sorted(self.module_patterns, key=len, reverse=True)
+        ))
+        
+        # Repeated prompts (re-run notebook cells) skip the regex work
+        self._parse_prompt = functools.lru_cache(maxsize=256)(self._parse_prompt)
     
-    def parse_execution_request(self, prompt: str) -> Dict[str, Any]:
+    def parse_execution_request(self, prompt: str) -> ExecutionPlan:
         """Parse natural language execution request into structured format.
         
         Args:
@@ -40,6 +107,13 @@ class NaturalLanguageExecutor:
         Returns:
             Structured execution plan
         """
+        module, operation, files, parameters = self._parse_prompt(prompt)
+        
+        # Build a fresh plan so callers can modify it without touching the cache
+        return ExecutionPlan(module, operation, list(files), dict(parameters))
+    
+    def _parse_prompt(self, prompt: str) -> Tuple[Optional[str], str, Tuple[str, ...], Tuple]:
+        """Parse a prompt into immutable parts (cached per prompt in __init__)."""
         prompt_lower = prompt.lower()
         
         # Identify module to run
@@ -51,17 +125,9 @@ class NaturalLanguageExecutor:
         # Determine operation type
         operation = self._determine_operation(prompt_lower)
         
-        # Build execution plan
-        plan = {
-            "module": module,
-            "operation": operation,
-            "inputs": {
-                "files": files,
-                "parameters": self._extract_parameters(prompt)
-            }
-        }
+        parameters = self._extract_parameters(prompt, prompt_lower)
         
-        return plan
+        return module, operation, tuple(files), tuple(parameters.items())
     
     def execute_from_prompt(self, prompt: str, dry_run: bool = False) -> Dict[str, Any]:
         """Execute GATK-SV workflow based on natural language prompt.
@@ -81,7 +147,7 @@ class NaturalLanguageExecutor:
                 return self._format_execution_plan(plan)
             
             # Execute based on module
-            if plan["module"]:
+            if plan.module:
                 return self._execute_module(plan)
             else:
                 return {
@@ -96,23 +162,38 @@ class NaturalLanguageExecutor:
                 "message": str(e)
             }
     
+    def execute_from_prompts(self, prompts: List[str], dry_run: bool = False) -> List[Dict[str, Any]]:
+        """Execute several natural language requests in order.
+        
+        The prompts share this executor's compiled patterns and parse cache,
+        so repeated prompts in a batch are only parsed once.
+        
+        Args:
+            prompts: Natural language execution requests
+            dry_run: If True, only show what would be executed
+            
+        Returns:
+            One result (or plan) per prompt, in the same order
+        """
+        execute = self.execute_from_prompt
+        return [execute(prompt, dry_run=dry_run) for prompt in prompts]
+    
     def _identify_module(self, prompt_lower: str) -> Optional[str]:
         """Identify which GATK-SV module to run."""
         # Check for explicit module mentions
-        for pattern, modules in self.module_patterns.items():
-            if pattern in prompt_lower:
-                return modules[0]
+        keyword_match = self._module_keyword_re.search(prompt_lower)
+        if keyword_match:
+            return self.module_patterns[keyword_match.group()][0]
         
         # Check for specific module names
-        module_match = re.search(r'module\s*(\d+[a-c]?)', prompt_lower)
+        module_match = _MODULE_RE.search(prompt_lower)
         if module_match:
             return f"Module{module_match.group(1).zfill(2)}"
         
-        # Check for workflow names
-        if "gathersampleevidence" in prompt_lower.replace(" ", ""):
-            return "GatherSampleEvidence"
-        elif "evidenceqc" in prompt_lower.replace(" ", ""):
-            return "EvidenceQC"
+        # Check for workflow names, with or without spaces between words
+        workflow_match = _WORKFLOW_RE.search(prompt_lower)
+        if workflow_match:
+            return workflow_match.lastgroup
         
         return None
     
@@ -121,40 +202,45 @@ class NaturalLanguageExecutor:
         files = []
         
         # Look for quoted paths
-        quoted_paths = re.findall(r'["\']([^"\']+)["\']', prompt)
+        quoted_paths = _QUOTED_RE.findall(prompt)
         files.extend(quoted_paths)
         
         # Look for paths with extensions
-        path_pattern = r'[\w/\-\.]+\.(bam|cram|vcf|bed|fa|fasta)'
-        paths = re.findall(path_pattern, prompt, re.IGNORECASE)
+        paths = _PATH_RE.findall(prompt)
         files.extend(paths)
         
         # Look for numbered files (e.g., "these 3 files")
         if "these" in prompt and "files" in prompt:
             # Extract any paths after "these X files"
-            after_files = prompt.split("files")[-1]
-            paths = re.findall(r'[\w/\-\.]+', after_files)
-            files.extend([p for p in paths if '.' in p])
+            after_files = prompt.rpartition("files")[2]
+            files.extend(
+                match[0] for match in _TOKEN_RE.finditer(after_files) if '.' in match[0]
+            )
         
-        return list(set(files))  # Remove duplicates
+        return list(dict.fromkeys(files))  # Remove duplicates, keep prompt order
     
-    def _extract_parameters(self, prompt: str) -> Dict[str, Any]:
-        """Extract parameters from prompt."""
+    def _extract_parameters(self, prompt: str, prompt_lower: str) -> Dict[str, Any]:
+        """Extract parameters from prompt.
+        
+        Args:
+            prompt: Original prompt, used where values keep their case
+            prompt_lower: Lowercased prompt, shared with the other parsers
+        """
         params = {}
         
         # Extract reference genome
-        if "hg38" in prompt.lower():
+        if "hg38" in prompt_lower:
             params["reference"] = "hg38"
-        elif "hg19" in prompt.lower() or "grch37" in prompt.lower():
+        elif "hg19" in prompt_lower or "grch37" in prompt_lower:
             params["reference"] = "hg19"
         
         # Extract output directory
-        output_match = re.search(r'output\s+(?:to|in|directory)?\s*["\']?([^\s"\']+)', prompt, re.IGNORECASE)
+        output_match = _OUTPUT_RE.search(prompt)
         if output_match:
             params["output_dir"] = output_match.group(1)
         
         # Extract sample names
-        sample_match = re.search(r'sample\s+(?:name|id)?\s*["\']?(\w+)', prompt, re.IGNORECASE)
+        sample_match = _SAMPLE_RE.search(prompt)
         if sample_match:
             params["sample_id"] = sample_match.group(1)
         
@@ -162,42 +248,34 @@ class NaturalLanguageExecutor:
     
     def _determine_operation(self, prompt_lower: str) -> str:
         """Determine what operation to perform."""
-        if any(word in prompt_lower for word in ["run", "execute", "process", "analyze"]):
-            return "execute"
-        elif any(word in prompt_lower for word in ["check", "validate", "verify"]):
-            return "validate"
-        elif any(word in prompt_lower for word in ["convert", "transform"]):
-            return "convert"
-        else:
-            return "execute"  # Default
+        return first_matching_tier(prompt_lower, _OPERATION_KEYWORDS) or "execute"  # Default
     
-    def _execute_module(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+    def _execute_module(self, plan: ExecutionPlan) -> Dict[str, Any]:
         """Execute a specific GATK-SV module."""
-        module = plan["module"]
-        inputs = plan["inputs"]
+        module = plan.module
         
         # Get CWL file for module
-        cwl_dir = Path("src/sv_agent/cwl")
-        cwl_file = cwl_dir / f"{module}.cwl"
+        cwl_file = _CWL_DIR / f"{module}.cwl"
         
-        if not cwl_file.exists():
+        if module not in self._get_cwl_manifest():
             # Try to convert it first
-            self.agent.convert_gatksv_to_cwl(cwl_dir, [module])
+            self.agent.convert_gatksv_to_cwl(_CWL_DIR, [module])
             if not cwl_file.exists():
                 return {
                     "status": "error",
                     "message": f"CWL file not found for {module}. Conversion may have failed."
                 }
+            self._cwl_manifest.add(module)
         
         # Prepare inputs YAML
-        input_config = self._prepare_module_inputs(module, inputs)
+        input_config = self._prepare_module_inputs(module, plan.files, plan.parameters)
         
         # Execute using agent's execution engine
         if self.agent.execution_engine:
             result = self.agent.execute_workflow(
                 str(cwl_file),
                 input_config,
-                output_dir=inputs.get("parameters", {}).get("output_dir")
+                output_dir=plan.parameters.get("output_dir")
             )
             
             return {
@@ -213,13 +291,31 @@ class NaturalLanguageExecutor:
                 "message": "No execution engine available. Install cwltool: pip install cwltool"
             }
     
-    def _prepare_module_inputs(self, module: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare input configuration for a specific module."""
-        files = inputs.get("files", [])
-        params = inputs.get("parameters", {})
+    def _get_cwl_manifest(self) -> Set[str]:
+        """Get the modules that already have a converted CWL file.
         
+        The directory is listed once per executor; modules converted later
+        are added by ``_execute_module``.
+        """
+        if self._cwl_manifest is None:
+            try:
+                with os.scandir(_CWL_DIR) as entries:
+                    self._cwl_manifest = {
+                        entry.name[:-len(".cwl")]
+                        for entry in entries
+                        if entry.name.endswith(".cwl") and entry.is_file()
+                    }
+            except OSError:
+                self._cwl_manifest = set()
+        return self._cwl_manifest
+    
+    def _prepare_module_inputs(self,
+                               module: str,
+                               files: List[str],
+                               params: Dict[str, Any]) -> Dict[str, Any]:
+        """Prepare input configuration for a specific module."""
         # Module-specific input preparation
-        if module in ["Module00a", "GatherSampleEvidence"]:
+        if module in _SAMPLE_QC_MODULES:
             # Sample QC module
             return {
                 "bam_or_cram_file": {
@@ -233,7 +329,7 @@ class NaturalLanguageExecutor:
                 }
             }
         
-        elif module in ["Module00b", "EvidenceQC"]:
+        elif module in _EVIDENCE_QC_MODULES:
             # Evidence QC module
             return {
                 "evidence_files": [
@@ -250,34 +346,33 @@ class NaturalLanguageExecutor:
             **params
         }
     
-    def _format_execution_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+    def _format_execution_plan(self, plan: ExecutionPlan) -> Dict[str, Any]:
         """Format execution plan for dry run display."""
-        module_info = self.knowledge.get_module_info(plan["module"]) if plan["module"] else {}
+        module_info = self.knowledge.get_module_info(plan.module) if plan.module else {}
         
         return {
             "status": "dry_run",
             "plan": {
-                "module": plan["module"],
+                "module": plan.module,
                 "module_info": module_info,
-                "operation": plan["operation"],
-                "inputs": plan["inputs"],
+                "operation": plan.operation,
+                "inputs": plan.inputs,
                 "commands": self._generate_commands(plan)
             },
             "message": "Dry run - no execution performed"
         }
     
-    def _generate_commands(self, plan: Dict[str, Any]) -> List[str]:
+    def _generate_commands(self, plan: ExecutionPlan) -> List[str]:
         """Generate commands that would be executed."""
-        commands = []
-        
-        # Convert command if needed
-        if plan["operation"] == "convert":
-            commands.append(f"sv-agent convert -m {plan['module']}")
-        
-        # Execution command
-        if plan["operation"] == "execute":
-            cwl_file = f"src/sv_agent/cwl/{plan['module']}.cwl"
-            input_yaml = f"{plan['module']}_inputs.yaml"
-            commands.append(f"sv-agent run {cwl_file} {input_yaml}")
+        key = (plan.operation, plan.module)
+        commands = self._command_cache.get(key)
+        if commands is None:
+            if plan.operation == "convert":
+                commands = (_CONVERT_COMMAND.format(module=plan.module),)
+            elif plan.operation == "execute":
+                commands = (_RUN_COMMAND.format(module=plan.module),)
+            else:
+                commands = ()
+            self._command_cache[key] = commands
         
-        return commands
\ No newline at end of file
+        return list(commands)
\ No newline at end of file
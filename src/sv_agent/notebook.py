@@ -7,7 +7,100 @@ import json
 
 from .agent import SVAgent
 from .chat import SVAgentChat
-from .knowledge import SVKnowledgeBase
+from .knowledge import get_shared_knowledge_base
+
+# Static notebook HTML/Markdown, built once at import
+_WELCOME_HTML = """
+        <div style="background-color: #f0f8ff; padding: 20px; border-radius: 10px; border: 2px solid #4169e1;">
+            <h2 style="color: #4169e1; margin-top: 0;">🧬 SV-Agent Notebook Interface</h2>
+            <p style="font-size: 16px;">Welcome to your domain-specific agent for structural variant analysis!</p>
+            <p style="margin-bottom: 0;">Quick start:</p>
+            <ul style="margin-top: 5px;">
+                <li><code>agent.help()</code> - See available commands</li>
+                <li><code>agent.ask("your question")</code> - Ask about SV analysis</li>
+                <li><code>agent.explain("Module00a")</code> - Get detailed explanations</li>
+                <li><code>agent.convert_module("Module00a")</code> - Convert WDL to CWL</li>
+            </ul>
+        </div>
+        """
+
+_MODULES_TABLE_HEADER = """
+        <h3>GATK-SV Pipeline Modules</h3>
+        <table style="width: 100%; border-collapse: collapse;">
+        <tr style="background-color: #f0f8ff;">
+            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Module</th>
+            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Name</th>
+            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Purpose</th>
+        </tr>
+        """
+
+_SV_TYPES_HEADER = """
+        <h3>Structural Variant Types</h3>
+        <table style="width: 100%; border-collapse: collapse;">
+        <tr style="background-color: #f0f8ff;">
+            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Type</th>
+            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Name</th>
+            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Description</th>
+            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Min Size</th>
+        </tr>
+        """
+
+_WORKFLOW_SUMMARY_HTML = """
+            <table style="width: 50%; border-collapse: collapse;">
+            <tr><td style="padding: 5px; border: 1px solid #ddd;"><b>Inputs</b></td>
+                <td style="padding: 5px; border: 1px solid #ddd;">{inputs}</td></tr>
+            <tr><td style="padding: 5px; border: 1px solid #ddd;"><b>Outputs</b></td>
+                <td style="padding: 5px; border: 1px solid #ddd;">{outputs}</td></tr>
+            <tr><td style="padding: 5px; border: 1px solid #ddd;"><b>Tasks</b></td>
+                <td style="padding: 5px; border: 1px solid #ddd;">{tasks}</td></tr>
+            <tr><td style="padding: 5px; border: 1px solid #ddd;"><b>Calls</b></td>
+                <td style="padding: 5px; border: 1px solid #ddd;">{calls}</td></tr>
+            <tr><td style="padding: 5px; border: 1px solid #ddd;"><b>Max Parallelism</b></td>
+                <td style="padding: 5px; border: 1px solid #ddd;">{max_parallelism}</td></tr>
+            </table>
+            """
+
+_WORKFLOW_VIZ_MARKDOWN = """
+### Workflow Visualization: {workflow_name}
+
+```
+┌─────────────────────────┐
+│  {workflow_name:<21} │
+├─────────────────────────┤
+│  Inputs: {inputs:<14} │
+│  Tasks: {tasks:<15} │
+│  Outputs: {outputs:<13} │
+└─────────────────────────┘
+        ↓
+    [Processing]
+        ↓
+┌─────────────────────────┐
+│  Statistics:            │
+├─────────────────────────┤
+│  Total calls: {total_calls:<9} │
+│  Max parallel: {max_parallelism:<8} │
+│  Has cycles: {has_cycles!s:<10} │
+└─────────────────────────┘
+```
+"""
+
+# Row templates for the module and SV type tables
+_MODULE_ROW = """
+            <tr>
+                <td style="padding: 8px; border: 1px solid #ddd;"><b>{module_id}</b></td>
+                <td style="padding: 8px; border: 1px solid #ddd;">{name}</td>
+                <td style="padding: 8px; border: 1px solid #ddd;">{purpose}</td>
+            </tr>
+            """
+
+_SV_TYPE_ROW = """
+            <tr>
+                <td style="padding: 8px; border: 1px solid #ddd;"><b>{sv_type}</b></td>
+                <td style="padding: 8px; border: 1px solid #ddd;">{name}</td>
+                <td style="padding: 8px; border: 1px solid #ddd;">{description}</td>
+                <td style="padding: 8px; border: 1px solid #ddd;">{min_size}bp</td>
+            </tr>
+            """
 
 
 class SVAgentNotebook:
@@ -17,27 +110,14 @@ class SVAgentNotebook:
         """Initialize notebook interface."""
         self.agent = SVAgent(config)
         self.chat = SVAgentChat(self.agent)
-        self.knowledge = SVKnowledgeBase()
+        self.knowledge = get_shared_knowledge_base()
         
         # Display welcome message
         self._display_welcome()
     
     def _display_welcome(self):
         """Display welcome message in notebook."""
-        welcome_html = """
-        <div style="background-color: #f0f8ff; padding: 20px; border-radius: 10px; border: 2px solid #4169e1;">
-            <h2 style="color: #4169e1; margin-top: 0;">🧬 SV-Agent Notebook Interface</h2>
-            <p style="font-size: 16px;">Welcome to your domain-specific agent for structural variant analysis!</p>
-            <p style="margin-bottom: 0;">Quick start:</p>
-            <ul style="margin-top: 5px;">
-                <li><code>agent.help()</code> - See available commands</li>
-                <li><code>agent.ask("your question")</code> - Ask about SV analysis</li>
-                <li><code>agent.explain("Module00a")</code> - Get detailed explanations</li>
-                <li><code>agent.convert_module("Module00a")</code> - Convert WDL to CWL</li>
-            </ul>
-        </div>
-        """
-        display(HTML(welcome_html))
+        display(HTML(_WELCOME_HTML))
     
     def help(self):
         """Display help information."""
@@ -100,53 +180,32 @@ class SVAgentNotebook:
     
     def show_modules(self):
         """Display all GATK-SV modules in a formatted table."""
-        html = """
-        <h3>GATK-SV Pipeline Modules</h3>
-        <table style="width: 100%; border-collapse: collapse;">
-        <tr style="background-color: #f0f8ff;">
-            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Module</th>
-            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Name</th>
-            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Purpose</th>
-        </tr>
-        """
+        parts = [_MODULES_TABLE_HEADER]
         
-        for module_id, info in self.knowledge.modules.items():
-            html += f"""
-            <tr>
-                <td style="padding: 8px; border: 1px solid #ddd;"><b>{module_id}</b></td>
-                <td style="padding: 8px; border: 1px solid #ddd;">{info['name']}</td>
-                <td style="padding: 8px; border: 1px solid #ddd;">{info['purpose']}</td>
-            </tr>
-            """
+        parts.extend(
+            _MODULE_ROW.format(module_id=module_id, name=info['name'], purpose=info['purpose'])
+            for module_id, info in self.knowledge.modules.items()
+        )
         
-        html += "</table>"
-        display(HTML(html))
+        parts.append("</table>")
+        display(HTML("".join(parts)))
     
     def show_sv_types(self):
         """Display SV types in a formatted table."""
-        html = """
-        <h3>Structural Variant Types</h3>
-        <table style="width: 100%; border-collapse: collapse;">
-        <tr style="background-color: #f0f8ff;">
-            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Type</th>
-            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Name</th>
-            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Description</th>
-            <th style="padding: 10px; text-align: left; border: 1px solid #ddd;">Min Size</th>
-        </tr>
-        """
+        parts = [_SV_TYPES_HEADER]
         
-        for sv_type, info in self.knowledge.sv_types.items():
-            html += f"""
-            <tr>
-                <td style="padding: 8px; border: 1px solid #ddd;"><b>{sv_type}</b></td>
-                <td style="padding: 8px; border: 1px solid #ddd;">{info['name']}</td>
-                <td style="padding: 8px; border: 1px solid #ddd;">{info['description']}</td>
-                <td style="padding: 8px; border: 1px solid #ddd;">{info['min_size']}bp</td>
-            </tr>
-            """
+        parts.extend(
+            _SV_TYPE_ROW.format(
+                sv_type=sv_type,
+                name=info['name'],
+                description=info['description'],
+                min_size=info['min_size']
+            )
+            for sv_type, info in self.knowledge.sv_types.items()
+        )
         
-        html += "</table>"
-        display(HTML(html))
+        parts.append("</table>")
+        display(HTML("".join(parts)))
     
     def convert_module(self, module_name: str, output_dir: str = "cwl_output"):
         """Convert a specific GATK-SV module to CWL."""
@@ -197,20 +256,13 @@ Output directory: `{output_dir}/`
             display(Markdown(f"### Workflow Analysis: {analysis['name']}"))
             
             # Create summary table
-            html = f"""
-            <table style="width: 50%; border-collapse: collapse;">
-            <tr><td style="padding: 5px; border: 1px solid #ddd;"><b>Inputs</b></td>
-                <td style="padding: 5px; border: 1px solid #ddd;">{analysis['inputs']}</td></tr>
-            <tr><td style="padding: 5px; border: 1px solid #ddd;"><b>Outputs</b></td>
-                <td style="padding: 5px; border: 1px solid #ddd;">{analysis['outputs']}</td></tr>
-            <tr><td style="padding: 5px; border: 1px solid #ddd;"><b>Tasks</b></td>
-                <td style="padding: 5px; border: 1px solid #ddd;">{analysis['tasks']}</td></tr>
-            <tr><td style="padding: 5px; border: 1px solid #ddd;"><b>Calls</b></td>
-                <td style="padding: 5px; border: 1px solid #ddd;">{analysis['calls']}</td></tr>
-            <tr><td style="padding: 5px; border: 1px solid #ddd;"><b>Max Parallelism</b></td>
-                <td style="padding: 5px; border: 1px solid #ddd;">{analysis['statistics']['max_parallelism']}</td></tr>
-            </table>
-            """
+            html = _WORKFLOW_SUMMARY_HTML.format(
+                inputs=analysis['inputs'],
+                outputs=analysis['outputs'],
+                tasks=analysis['tasks'],
+                calls=analysis['calls'],
+                max_parallelism=analysis['statistics']['max_parallelism']
+            )
             display(HTML(html))
             
             if analysis['imports']:
@@ -283,29 +335,15 @@ Output directory: `{output_dir}/`
             analysis = self.agent.analyze_gatksv_workflow(workflow_name)
             
             # Create a simple text-based visualization
-            viz = f"""
-### Workflow Visualization: {workflow_name}
-
-```
-┌─────────────────────────┐
-│  {workflow_name:<21} │
-├─────────────────────────┤
-│  Inputs: {analysis['inputs']:<14} │
-│  Tasks: {analysis['tasks']:<15} │
-│  Outputs: {analysis['outputs']:<13} │
-└─────────────────────────┘
-        ↓
-    [Processing]
-        ↓
-┌─────────────────────────┐
-│  Statistics:            │
-├─────────────────────────┤
-│  Total calls: {analysis['statistics']['total_calls']:<9} │
-│  Max parallel: {analysis['statistics']['max_parallelism']:<8} │
-│  Has cycles: {str(analysis['statistics']['has_cycles']):<10} │
-└─────────────────────────┘
-```
-"""
+            viz = _WORKFLOW_VIZ_MARKDOWN.format(
+                workflow_name=workflow_name,
+                inputs=analysis['inputs'],
+                tasks=analysis['tasks'],
+                outputs=analysis['outputs'],
+                total_calls=analysis['statistics']['total_calls'],
+                max_parallelism=analysis['statistics']['max_parallelism'],
+                has_cycles=analysis['statistics']['has_cycles']
+            )
             display(Markdown(viz))
             
         except Exception as e:
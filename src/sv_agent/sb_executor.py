@@ -1,82 +1,202 @@
 """Seven Bridges platform execution module for sv-agent."""
 
+import functools
 import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 import re
 
+from .matching import first_matching_tier
+
 logger = logging.getLogger(__name__)
 
+_MODULE_RE = re.compile(r'module\s*(\d+[a-c]?)')
+
+_MODULE_KEYWORDS = {
+    "qc": "Module00a",
+    "sample qc": "Module00a",
+    "evidence": "Module00b",
+    "batch qc": "Module00c",
+    "clustering": "Module01",
+    "filtering": "Module03",
+    "genotyping": "Module04",
+    "gathersampleevidence": "GatherSampleEvidence",
+    "gather sample evidence": "GatherSampleEvidence",
+}
+# One scan finds the earliest keyword; longer keywords go first so
+# "batch qc" wins over "qc" and the workflow name over "evidence"
+_MODULE_KEYWORD_RE = re.compile("|".join(
+    re.escape(keyword) for keyword in sorted(_MODULE_KEYWORDS, key=len, reverse=True)
+))
+
+# Platform paths, quoted local paths (which may contain spaces) and bare
+# local paths, in one scan. Only the quoted form captures a group.
+_FILE_RE = re.compile(
+    r'sbg://[\w\-/\.]+'
+    r'|["\'](?P<quoted>[^"\']+\.(?:bam|cram|vcf|bed|fasta|fa)(?:\.b?gz)?)["\']'
+    r'|[\w/\-\.]+\.(?:bam|cram|vcf|bed|fasta|fa)(?:\.b?gz)?\b',
+    re.IGNORECASE
+)
+
+_PROJECT_KW_RE = re.compile(r'project\s+([a-zA-Z0-9\-_]+/[a-zA-Z0-9\-_]+)')
+_PROJECT_RE = re.compile(r'([a-zA-Z0-9\-_]+/[a-zA-Z0-9\-_]+)')
+
+# Instance size keywords in priority order; the first size mentioned in
+# this order wins regardless of where it appears in the prompt. Keywords
+# match whole words only, so "ram" doesn't match "program".
+_INSTANCE_SIZE_KEYWORDS = (
+    ("large", ("large", "big", "high memory", "intensive")),
+    ("small", ("small", "quick", "test")),
+    ("medium", ("medium", "batch")),
+    ("memory", ("memory", "ram")),
+)
+
+# Rough time estimates by module (hours); other modules assume 4
+_MODULE_HOURS = {
+    "Module00a": 2,
+    "Module00b": 4,
+    "Module00c": 1,
+    "Module01": 6,
+    "Module03": 3,
+    "Module04": 8
+}
+
+# Rough cost per hour by instance type (USD)
+_INSTANCE_HOURLY_USD = {
+    "small": 0.20,
+    "medium": 0.80,
+    "large": 1.80,
+    "memory": 1.20
+}
+
+_SB_COMMANDS_TEMPLATE = """\
+# Set Seven Bridges profile
+sb config set endpoint {platform_url}
+sb config set token YOUR_AUTH_TOKEN
+
+# Upload CWL workflow
+sb apps install-workflow src/sv_agent/cwl/{module}.cwl {project}
+
+# Create and submit task
+sb tasks create \\
+  --project {project} \\
+  --app {project}/{module_lower} \\
+  --name '{module}-execution' \\
+  --inputs '{inputs_json}' \\
+  --instance-type {instance_type}
+
+# Monitor execution
+sb tasks list --project {project} --status RUNNING"""
+
+
+def _find_files(text: str) -> List[str]:
+    """Return file references in ``text``, deduplicated in order of appearance."""
+    # Stream matches straight into the dedup dict, no intermediate list
+    files = dict.fromkeys(match["quoted"] or match[0] for match in _FILE_RE.finditer(text))
+    return list(files)
+
 
 class SevenBridgesExecutor:
     """Execute GATK-SV workflows on Seven Bridges platforms."""
     
+    __slots__ = ("agent", "_parse_prompt")
+    
+    # Available Seven Bridges platforms
+    PLATFORMS = {
+        "cgc": {
+            "name": "Cancer Genomics Cloud",
+            "url": "https://cgc-api.sbgenomics.com/v2",
+            "description": "NIH Cancer Genomics Cloud for cancer research",
+            "pricing": "Free tier available with TCGA/TARGET data access"
+        },
+        "cavatica": {
+            "name": "CAVATICA", 
+            "url": "https://cavatica-api.sbgenomics.com/v2",
+            "description": "Kids First Data Resource Center platform for pediatric research",
+            "pricing": "Free tier available with Kids First data access"
+        },
+        "aws": {
+            "name": "Seven Bridges Platform (AWS)",
+            "url": "https://api.sbgenomics.com/v2", 
+            "description": "Commercial platform on AWS infrastructure",
+            "pricing": "Pay-per-use pricing"
+        },
+        "gcp": {
+            "name": "Seven Bridges Platform (GCP)",
+            "url": "https://gcp-api.sbgenomics.com/v2",
+            "description": "Commercial platform on Google Cloud infrastructure", 
+            "pricing": "Pay-per-use pricing"
+        },
+        "azure": {
+            "name": "Seven Bridges Platform (Azure)",
+            "url": "https://eu-api.sbgenomics.com/v2",
+            "description": "Commercial platform on Azure infrastructure",
+            "pricing": "Pay-per-use pricing"
+        }
+    }
+    
+    # Instance types for different workloads
+    INSTANCE_TYPES = {
+        "small": {
+            "name": "c5.xlarge",
+            "cpu": 4,
+            "memory": 8,
+            "description": "Small workloads, single sample QC"
+        },
+        "medium": {
+            "name": "c5.4xlarge", 
+            "cpu": 16,
+            "memory": 32,
+            "description": "Medium workloads, batch processing"
+        },
+        "large": {
+            "name": "c5.9xlarge",
+            "cpu": 36,
+            "memory": 72,
+            "description": "Large workloads, cohort analysis"
+        },
+        "memory": {
+            "name": "r5.4xlarge",
+            "cpu": 16,
+            "memory": 128,
+            "description": "Memory-intensive tasks, large references"
+        }
+    }
+    
+    # Platform keys and display names, in priority order
+    _PLATFORM_KEYWORDS = tuple(
+        (key, (key, info["name"].lower())) for key, info in PLATFORMS.items()
+    )
+    _PLATFORM_KEYS = tuple(PLATFORMS)
+    
+    # Choice options shown by the dialog; the tables above never change
+    _PLATFORM_OPTIONS = tuple(
+        f"{key}: {info['name']} - {info['description']}"
+        for key, info in PLATFORMS.items()
+    )
+    _MODULE_OPTIONS = (
+        "Module00a: Sample QC (GatherSampleEvidence)",
+        "Module00b: Evidence Collection",
+        "Module00c: Batch QC",
+        "Module01: Clustering",
+        "Module03: Filtering",
+        "Module04: Genotyping"
+    )
+    _INSTANCE_OPTIONS = tuple(
+        f"{key}: {info['name']} ({info['cpu']} CPU, {info['memory']} GB RAM) - {info['description']}"
+        for key, info in INSTANCE_TYPES.items()
+    )
+    
+    # Plan fields the dialog must fill, in the order they are asked about
+    _REQUIRED_FIELDS = ("platform", "module", "files", "project", "instance_size")
+    
     def __init__(self, agent=None):
         """Initialize Seven Bridges executor."""
         self.agent = agent
         
-        # Available Seven Bridges platforms
-        self.platforms = {
-            "cgc": {
-                "name": "Cancer Genomics Cloud",
-                "url": "https://cgc-api.sbgenomics.com/v2",
-                "description": "NIH Cancer Genomics Cloud for cancer research",
-                "pricing": "Free tier available with TCGA/TARGET data access"
-            },
-            "cavatica": {
-                "name": "CAVATICA", 
-                "url": "https://cavatica-api.sbgenomics.com/v2",
-                "description": "Kids First Data Resource Center platform for pediatric research",
-                "pricing": "Free tier available with Kids First data access"
-            },
-            "aws": {
-                "name": "Seven Bridges Platform (AWS)",
-                "url": "https://api.sbgenomics.com/v2", 
-                "description": "Commercial platform on AWS infrastructure",
-                "pricing": "Pay-per-use pricing"
-            },
-            "gcp": {
-                "name": "Seven Bridges Platform (GCP)",
-                "url": "https://gcp-api.sbgenomics.com/v2",
-                "description": "Commercial platform on Google Cloud infrastructure", 
-                "pricing": "Pay-per-use pricing"
-            },
-            "azure": {
-                "name": "Seven Bridges Platform (Azure)",
-                "url": "https://eu-api.sbgenomics.com/v2",
-                "description": "Commercial platform on Azure infrastructure",
-                "pricing": "Pay-per-use pricing"
-            }
-        }
-        
-        # Instance types for different workloads
-        self.instance_types = {
-            "small": {
-                "name": "c5.xlarge",
-                "cpu": 4,
-                "memory": 8,
-                "description": "Small workloads, single sample QC"
-            },
-            "medium": {
-                "name": "c5.4xlarge", 
-                "cpu": 16,
-                "memory": 32,
-                "description": "Medium workloads, batch processing"
-            },
-            "large": {
-                "name": "c5.9xlarge",
-                "cpu": 36,
-                "memory": 72,
-                "description": "Large workloads, cohort analysis"
-            },
-            "memory": {
-                "name": "r5.4xlarge",
-                "cpu": 16,
-                "memory": 128,
-                "description": "Memory-intensive tasks, large references"
-            }
-        }
+        # Dialog retries resend the same prompt; skip the regex work
+        self._parse_prompt = functools.lru_cache(maxsize=256)(self._scan_prompt)
     
     def initiate_execution_dialog(self, prompt: str) -> Dict[str, Any]:
         """Start interactive dialog for Seven Bridges execution."""
@@ -103,17 +223,27 @@ class SevenBridgesExecutor:
     
     def _parse_sb_request(self, prompt: str) -> Dict[str, Any]:
         """Parse Seven Bridges execution request."""
+        platform, module, files, project, instance_size = self._parse_prompt(prompt)
+        
+        # Build a fresh plan so the dialog can update it without touching the cache
+        return {
+            "platform": platform,
+            "module": module,
+            "files": list(files),
+            "project": project,
+            "instance_size": instance_size,
+            "original_prompt": prompt
+        }
+    
+    def _scan_prompt(self, prompt: str) -> Tuple[Optional[str], Optional[str], Tuple[str, ...], Optional[str], Optional[str]]:
+        """Parse a prompt into immutable parts (cached as _parse_prompt in __init__)."""
         prompt_lower = prompt.lower()
         
         # Extract platform preference
-        platform = None
-        for key, info in self.platforms.items():
-            if key in prompt_lower or info["name"].lower() in prompt_lower:
-                platform = key
-                break
+        platform = first_matching_tier(prompt_lower, self._PLATFORM_KEYWORDS)
         
         # Extract module/workflow
-        module = self._extract_module(prompt)
+        module = self._extract_module(prompt_lower)
         
         # Extract files
         files = self._extract_file_references(prompt)
@@ -122,234 +252,168 @@ class SevenBridgesExecutor:
         project = self._extract_project(prompt)
         
         # Extract instance size preference
-        instance_size = self._extract_instance_size(prompt)
+        instance_size = self._extract_instance_size(prompt_lower)
         
-        return {
-            "platform": platform,
-            "module": module,
-            "files": files,
-            "project": project,
-            "instance_size": instance_size,
-            "original_prompt": prompt
-        }
+        return platform, module, tuple(files), project, instance_size
     
-    def _extract_module(self, prompt: str) -> Optional[str]:
-        """Extract GATK-SV module from prompt."""
-        prompt_lower = prompt.lower()
-        
+    def _extract_module(self, prompt_lower: str) -> Optional[str]:
+        """Extract GATK-SV module from the lowercased prompt."""
         # Direct module references
-        module_match = re.search(r'module\s*(\d+[a-c]?)', prompt_lower)
+        module_match = _MODULE_RE.search(prompt_lower)
         if module_match:
             return f"Module{module_match.group(1).zfill(2)}"
         
-        # Module keywords
-        module_keywords = {
-            "qc": "Module00a",
-            "sample qc": "Module00a", 
-            "evidence": "Module00b",
-            "batch qc": "Module00c",
-            "clustering": "Module01",
-            "filtering": "Module03",
-            "genotyping": "Module04"
-        }
-        
-        for keyword, module in module_keywords.items():
-            if keyword in prompt_lower:
-                return module
-        
-        # Workflow names
-        if "gathersampleevidence" in prompt_lower.replace(" ", ""):
-            return "GatherSampleEvidence"
+        # Module keywords and workflow names
+        keyword_match = _MODULE_KEYWORD_RE.search(prompt_lower)
+        if keyword_match:
+            return _MODULE_KEYWORDS[keyword_match.group()]
         
         return None
     
     def _extract_file_references(self, prompt: str) -> List[str]:
         """Extract file references (could be platform paths or local)."""
-        files = []
-        
-        # Seven Bridges file paths (sbg://)
-        sb_files = re.findall(r'sbg://[\w\-/\.]+', prompt)
-        files.extend(sb_files)
-        
-        # Regular file paths
-        file_patterns = [
-            r'[\w/\-\.]+\.(bam|cram|vcf|bed|fa|fasta)',
-            r'["\']([^"\']+\.(bam|cram|vcf|bed|fa|fasta))["\']'
-        ]
-        
-        for pattern in file_patterns:
-            matches = re.findall(pattern, prompt, re.IGNORECASE)
-            if isinstance(matches[0], tuple) if matches else False:
-                files.extend([m[0] for m in matches])
-            else:
-                files.extend(matches)
-        
-        return list(set(files))
+        return _find_files(prompt)
     
     def _extract_project(self, prompt: str) -> Optional[str]:
         """Extract Seven Bridges project reference."""
         # Project ID pattern (username/project)
-        project_match = re.search(r'project\s+([a-zA-Z0-9\-_]+/[a-zA-Z0-9\-_]+)', prompt)
+        project_match = _PROJECT_KW_RE.search(prompt)
         if project_match:
             return project_match.group(1)
         
         # Direct project reference
-        project_match = re.search(r'([a-zA-Z0-9\-_]+/[a-zA-Z0-9\-_]+)', prompt)
+        project_match = _PROJECT_RE.search(prompt)
         if project_match and "/" in project_match.group(1):
             return project_match.group(1)
         
         return None
     
-    def _extract_instance_size(self, prompt: str) -> Optional[str]:
-        """Extract instance size preference."""
-        prompt_lower = prompt.lower()
-        
-        if any(word in prompt_lower for word in ["large", "big", "high memory", "intensive"]):
-            return "large"
-        elif any(word in prompt_lower for word in ["small", "quick", "test"]):
-            return "small"
-        elif any(word in prompt_lower for word in ["medium", "batch"]):
-            return "medium"
-        elif any(word in prompt_lower for word in ["memory", "ram"]):
-            return "memory"
-        
-        return None
+    def _extract_instance_size(self, prompt_lower: str) -> Optional[str]:
+        """Extract instance size preference from the lowercased prompt."""
+        return first_matching_tier(prompt_lower, _INSTANCE_SIZE_KEYWORDS, whole_words=True)
     
     def _check_required_info(self, plan: Dict[str, Any]) -> List[str]:
         """Check what information is still needed."""
-        missing = []
-        
-        if not plan["platform"]:
-            missing.append("platform")
-        
-        if not plan["module"]:
-            missing.append("module") 
-        
-        if not plan["files"]:
-            missing.append("files")
-        
-        if not plan["project"]:
-            missing.append("project")
-        
-        if not plan["instance_size"]:
-            missing.append("instance_size")
-        
-        return missing
+        return [field for field in self._REQUIRED_FIELDS if not plan[field]]
     
     def _generate_questions(self, missing_info: List[str]) -> List[Dict[str, Any]]:
         """Generate questions to gather missing information."""
+        missing = set(missing_info)
         questions = []
         
-        if "platform" in missing_info:
-            questions.append({
-                "type": "choice",
-                "question": "Which Seven Bridges platform would you like to use?",
-                "options": [
-                    f"{key}: {info['name']} - {info['description']}" 
-                    for key, info in self.platforms.items()
-                ],
-                "field": "platform"
-            })
-        
-        if "module" in missing_info:
-            questions.append({
-                "type": "choice", 
-                "question": "Which GATK-SV module would you like to run?",
-                "options": [
-                    "Module00a: Sample QC (GatherSampleEvidence)",
-                    "Module00b: Evidence Collection", 
-                    "Module00c: Batch QC",
-                    "Module01: Clustering",
-                    "Module03: Filtering", 
-                    "Module04: Genotyping"
-                ],
-                "field": "module"
-            })
-        
-        if "files" in missing_info:
-            questions.append({
-                "type": "text",
-                "question": "What input files would you like to process? (Provide Seven Bridges file paths like sbg://project/file.bam or describe the files)",
-                "field": "files"
-            })
-        
-        if "project" in missing_info:
-            questions.append({
-                "type": "text", 
-                "question": "What Seven Bridges project should I use? (Format: username/project-name)",
-                "field": "project"
-            })
-        
-        if "instance_size" in missing_info:
-            questions.append({
-                "type": "choice",
-                "question": "What instance size would you like to use?",
-                "options": [
-                    f"{key}: {info['name']} ({info['cpu']} CPU, {info['memory']} GB RAM) - {info['description']}"
-                    for key, info in self.instance_types.items()
-                ],
-                "field": "instance_size"
-            })
+        if "platform" in missing:
+            questions.append(self._platform_question())
+        
+        if "module" in missing:
+            questions.append(self._module_question())
+        
+        if "files" in missing:
+            questions.append(self._files_question())
+        
+        if "project" in missing:
+            questions.append(self._project_question())
+        
+        if "instance_size" in missing:
+            questions.append(self._instance_size_question())
         
         return questions
     
+    def _platform_question(self) -> Dict[str, Any]:
+        """Question asking which platform to run on."""
+        return {
+            "type": "choice",
+            "question": "Which Seven Bridges platform would you like to use?",
+            "options": list(self._PLATFORM_OPTIONS),
+            "field": "platform"
+        }
+    
+    def _module_question(self) -> Dict[str, Any]:
+        """Question asking which GATK-SV module to run."""
+        return {
+            "type": "choice", 
+            "question": "Which GATK-SV module would you like to run?",
+            "options": list(self._MODULE_OPTIONS),
+            "field": "module"
+        }
+    
+    def _files_question(self) -> Dict[str, Any]:
+        """Question asking for the input files."""
+        return {
+            "type": "text",
+            "question": "What input files would you like to process? (Provide Seven Bridges file paths like sbg://project/file.bam or describe the files)",
+            "field": "files"
+        }
+    
+    def _project_question(self) -> Dict[str, Any]:
+        """Question asking for the Seven Bridges project."""
+        return {
+            "type": "text", 
+            "question": "What Seven Bridges project should I use? (Format: username/project-name)",
+            "field": "project"
+        }
+    
+    def _instance_size_question(self) -> Dict[str, Any]:
+        """Question asking for the compute instance size."""
+        return {
+            "type": "choice",
+            "question": "What instance size would you like to use?",
+            "options": list(self._INSTANCE_OPTIONS),
+            "field": "instance_size"
+        }
+    
     def update_plan_with_response(self, plan: Dict[str, Any], field: str, response: str) -> Dict[str, Any]:
         """Update execution plan with user response."""
-        updated_plan = plan.copy()
+        response_lower = response.lower()
+        value = None
         
         if field == "platform":
             # Extract platform key from response
             if response.strip().isdigit():
                 # Handle numeric response
-                platform_keys = list(self.platforms.keys())
                 choice = int(response.strip()) - 1
-                if 0 <= choice < len(platform_keys):
-                    updated_plan["platform"] = platform_keys[choice]
+                if 0 <= choice < len(self._PLATFORM_KEYS):
+                    value = self._PLATFORM_KEYS[choice]
             else:
                 # Handle text response
-                for key in self.platforms.keys():
-                    if key in response.lower():
-                        updated_plan["platform"] = key
+                for key in self._PLATFORM_KEYS:
+                    if key in response_lower:
+                        value = key
                         break
         
         elif field == "module":
             # Extract module from response
-            if "module00a" in response.lower() or "sample qc" in response.lower():
-                updated_plan["module"] = "Module00a"
-            elif "module00b" in response.lower() or "evidence collection" in response.lower():
-                updated_plan["module"] = "Module00b"
+            if "module00a" in response_lower or "sample qc" in response_lower:
+                value = "Module00a"
+            elif "module00b" in response_lower or "evidence collection" in response_lower:
+                value = "Module00b"
             # Add more module mappings...
         
         elif field == "files":
             # Parse file list from response
-            files = []
-            # Seven Bridges paths
-            sb_files = re.findall(r'sbg://[\w\-/\.]+', response)
-            files.extend(sb_files)
-            # Regular paths
-            file_matches = re.findall(r'[\w/\-\.]+\.(bam|cram|vcf|bed|fa|fasta)', response)
-            files.extend(file_matches)
-            updated_plan["files"] = files
+            value = _find_files(response)
         
         elif field == "project":
             # Extract project ID
-            project_match = re.search(r'([a-zA-Z0-9\-_]+/[a-zA-Z0-9\-_]+)', response)
+            project_match = _PROJECT_RE.search(response)
             if project_match:
-                updated_plan["project"] = project_match.group(1)
+                value = project_match.group(1)
         
         elif field == "instance_size":
             # Extract instance size
-            for key in self.instance_types.keys():
-                if key in response.lower():
-                    updated_plan["instance_size"] = key
+            for key in self.INSTANCE_TYPES:
+                if key in response_lower:
+                    value = key
                     break
         
-        return updated_plan
+        # Always hand back a new plan; the caller's plan is left untouched
+        if value is None:
+            return dict(plan)
+        return {**plan, field: value}
     
     def generate_execution_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
         """Generate detailed execution plan for Seven Bridges."""
-        platform_info = self.platforms[plan["platform"]]
-        instance_info = self.instance_types[plan["instance_size"]]
+        platform_info = self.PLATFORMS[plan["platform"]]
+        instance_info = self.INSTANCE_TYPES[plan["instance_size"]]
         
         # Estimate costs
         cost_estimate = self._estimate_costs(plan)
@@ -383,29 +447,8 @@ class SevenBridgesExecutor:
     
     def _estimate_costs(self, plan: Dict[str, Any]) -> Dict[str, Any]:
         """Estimate execution costs."""
-        instance_info = self.instance_types[plan["instance_size"]]
-        
-        # Rough time estimates by module (hours)
-        time_estimates = {
-            "Module00a": 2,
-            "Module00b": 4, 
-            "Module00c": 1,
-            "Module01": 6,
-            "Module03": 3,
-            "Module04": 8
-        }
-        
-        estimated_hours = time_estimates.get(plan["module"], 4)
-        
-        # Rough cost per hour by instance type (USD)
-        cost_per_hour = {
-            "small": 0.20,
-            "medium": 0.80,
-            "large": 1.80,
-            "memory": 1.20
-        }
-        
-        hourly_rate = cost_per_hour[plan["instance_size"]]
+        estimated_hours = _MODULE_HOURS.get(plan["module"], 4)
+        hourly_rate = _INSTANCE_HOURLY_USD[plan["instance_size"]]
         estimated_cost = estimated_hours * hourly_rate
         
         return {
@@ -417,29 +460,14 @@ class SevenBridgesExecutor:
     
     def generate_sb_commands(self, plan: Dict[str, Any]) -> List[str]:
         """Generate Seven Bridges CLI commands."""
-        platform_url = self.platforms[plan["platform"]]["url"]
-        
-        commands = [
-            f"# Set Seven Bridges profile",
-            f"sb config set endpoint {platform_url}",
-            f"sb config set token YOUR_AUTH_TOKEN",
-            f"",
-            f"# Upload CWL workflow",
-            f"sb apps install-workflow src/sv_agent/cwl/{plan['module']}.cwl {plan['project']}",
-            f"",
-            f"# Create and submit task",
-            f"sb tasks create \\",
-            f"  --project {plan['project']} \\",
-            f"  --app {plan['project']}/{plan['module'].lower()} \\",
-            f"  --name '{plan['module']}-execution' \\",
-            f"  --inputs '{json.dumps(self._format_sb_inputs(plan))}' \\",
-            f"  --instance-type {self.instance_types[plan['instance_size']]['name']}",
-            f"",
-            f"# Monitor execution",
-            f"sb tasks list --project {plan['project']} --status RUNNING"
-        ]
-        
-        return commands
+        return _SB_COMMANDS_TEMPLATE.format(
+            platform_url=self.PLATFORMS[plan["platform"]]["url"],
+            project=plan["project"],
+            module=plan["module"],
+            module_lower=plan["module"].lower(),
+            inputs_json=json.dumps(self._format_sb_inputs(plan)),
+            instance_type=self.INSTANCE_TYPES[plan["instance_size"]]["name"]
+        ).splitlines()
     
     def _format_sb_inputs(self, plan: Dict[str, Any]) -> Dict[str, Any]:
         """Format inputs for Seven Bridges execution."""
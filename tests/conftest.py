@@ -2,6 +2,10 @@
 
 import pytest
 import os
+import urllib.request
+
+
+OLLAMA_URL = "http://localhost:11434"
 
 
 def pytest_addoption(parser):
@@ -27,15 +31,34 @@ def pytest_configure(config):
     )
 
 
+def _ollama_available():
+    """Probe the Ollama server once for the whole run."""
+    try:
+        with urllib.request.urlopen(f"{OLLAMA_URL}/api/tags", timeout=2) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
 def pytest_collection_modifyitems(config, items):
     """Modify test collection based on markers."""
+    integration_items = [item for item in items if "integration" in item.keywords]
+    if not integration_items:
+        return
+    
     if not config.getoption("--run-integration"):
         skip_integration = pytest.mark.skip(
             reason="Integration tests skipped without --run-integration flag"
         )
-        for item in items:
-            if "integration" in item.keywords:
-                item.add_marker(skip_integration)
+    elif not _ollama_available():
+        skip_integration = pytest.mark.skip(
+            reason=f"Ollama not reachable at {OLLAMA_URL}"
+        )
+    else:
+        return
+    
+    for item in integration_items:
+        item.add_marker(skip_integration)
 
 
 @pytest.fixture(scope="session")
@@ -44,6 +67,13 @@ def ollama_model(pytestconfig):
     return pytestconfig.getoption("--ollama-model")
 
 
+@pytest.fixture(scope="module")
+def sv_agent():
+    """Shared SVAgent for tests that don't modify it."""
+    from sv_agent import SVAgent
+    return SVAgent()
+
+
 @pytest.fixture
 def mock_env(monkeypatch):
     """Mock environment variables for tests."""
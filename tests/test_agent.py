@@ -1,7 +1,7 @@
 """Tests for SVAgent."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from pathlib import Path
 
 from sv_agent import SVAgent
@@ -10,11 +10,10 @@ from sv_agent import SVAgent
 class TestSVAgent:
     """Test cases for SVAgent class."""
     
-    def test_agent_initialization(self):
+    def test_agent_initialization(self, sv_agent):
         """Test SVAgent initialization."""
-        agent = SVAgent()
-        assert agent.name == "SVAgent"
-        assert agent.gatksv_path.exists()
+        assert sv_agent.name == "SVAgent"
+        assert sv_agent.gatksv_path.exists()
     
     def test_agent_with_config(self):
         """Test SVAgent initialization with configuration."""
@@ -22,59 +21,51 @@ class TestSVAgent:
         agent = SVAgent(config=config)
         assert agent.config == config
     
-    def test_validate_batch_config_valid(self):
+    def test_validate_batch_config_valid(self, sv_agent):
         """Test batch configuration validation with valid config."""
-        agent = SVAgent()
         config = {
             "samples": ["sample1", "sample2"],
             "reference": "/path/to/reference.fa",
             "output_dir": "/path/to/output"
         }
         # Should not raise exception
-        agent._validate_batch_config(config)
+        sv_agent._validate_batch_config(config)
     
-    def test_validate_batch_config_missing_field(self):
+    def test_validate_batch_config_missing_field(self, sv_agent):
         """Test batch configuration validation with missing field."""
-        agent = SVAgent()
         config = {
             "samples": ["sample1", "sample2"],
             "reference": "/path/to/reference.fa"
             # Missing output_dir
         }
         with pytest.raises(ValueError, match="Missing required field: output_dir"):
-            agent._validate_batch_config(config)
+            sv_agent._validate_batch_config(config)
     
-    def test_prepare_workflow_inputs(self):
+    def test_prepare_workflow_inputs(self, sv_agent):
         """Test workflow input preparation."""
-        agent = SVAgent()
         config = {
             "samples": ["sample1", "sample2"],
             "reference": "/path/to/reference.fa",
             "output_dir": "/path/to/output"
         }
-        inputs = agent._prepare_workflow_inputs(config)
+        inputs = sv_agent._prepare_workflow_inputs(config)
         
         assert inputs["samples"] == config["samples"]
         assert inputs["reference"] == config["reference"]
         assert inputs["output_directory"] == config["output_dir"]
     
-    @patch('sv_agent.agent.WorkflowEngine')
-    def test_process_batch(self, mock_workflow_engine):
-        """Test batch processing."""
-        # Mock workflow engine
-        mock_engine = Mock()
-        mock_engine.run.return_value = {"status": "success", "outputs": {}}
-        mock_workflow_engine.return_value = mock_engine
-        
-        agent = SVAgent()
+    def test_process_batch(self, sv_agent):
+        """Test batch processing runs the SV batch step."""
         config = {
             "samples": ["sample1", "sample2"],
             "reference": "/path/to/reference.fa",
             "output_dir": "/path/to/output"
         }
         
-        results = agent.process_batch(config)
+        with patch.object(sv_agent, '_execute_batch', wraps=sv_agent._execute_batch) as mock_execute:
+            results = sv_agent.process_batch(config)
         
-        # Verify workflow was called
-        mock_engine.run.assert_called_once()
-        assert results["status"] == "success"
\ No newline at end of file
+        # Verify the SV batch step was called
+        mock_execute.assert_called_once()
+        assert results["status"] == "success"
+        assert results["samples_processed"] == 2
\ No newline at end of file
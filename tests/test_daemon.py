@@ -0,0 +1,144 @@
+"""Tests for the warm sv-agent daemon."""
+
+import os
+import stat
+import threading
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from sv_agent.daemon import SVAgentDaemon, ask_daemon, default_socket_path
+from sv_agent.main import main
+
+
+class TestSVAgentDaemon:
+    """Test cases for the daemon server and ask client."""
+
+    @pytest.fixture
+    def running_daemon(self, tmp_path):
+        """Start a daemon with a mock chat session on a temporary socket."""
+        chat = Mock()
+        chat.chat.side_effect = lambda question: f"Answer: {question}"
+
+        server = SVAgentDaemon(chat, tmp_path / "sv-agent.sock")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        yield server, chat
+
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    def test_ask_round_trip(self, running_daemon):
+        """Test a question is answered by the daemon's chat session."""
+        server, chat = running_daemon
+
+        response = ask_daemon("What is a deletion?", server.socket_path)
+
+        assert response == "Answer: What is a deletion?"
+        chat.chat.assert_called_once_with("What is a deletion?")
+
+    def test_chat_session_is_reused(self, running_daemon):
+        """Test consecutive questions share one chat session."""
+        server, chat = running_daemon
+
+        ask_daemon("Q1", server.socket_path)
+        ask_daemon("Q2", server.socket_path)
+
+        assert chat.chat.call_count == 2
+
+    def test_each_ask_starts_a_fresh_session(self, running_daemon):
+        """Test independent asks don't share memory or a pending dialog."""
+        server, chat = running_daemon
+
+        ask_daemon("Run module 01 on the cgc platform", server.socket_path)
+        ask_daemon("What is a deletion?", server.socket_path)
+
+        assert chat.mock_calls == [
+            call.reset(), call.chat("Run module 01 on the cgc platform"),
+            call.reset(), call.chat("What is a deletion?"),
+        ]
+
+    def test_chat_error_is_reported(self, running_daemon):
+        """Test chat failures are raised on the client side."""
+        server, chat = running_daemon
+        chat.chat.side_effect = Exception("model not loaded")
+
+        with pytest.raises(RuntimeError, match="model not loaded"):
+            ask_daemon("Q", server.socket_path)
+
+    def test_no_daemon_running(self, tmp_path):
+        """Test the client returns None when no daemon is listening."""
+        assert ask_daemon("Q", tmp_path / "missing.sock") is None
+
+    def test_foreign_socket_is_ignored(self, running_daemon):
+        """Test a socket owned by another user is never connected to."""
+        server, chat = running_daemon
+
+        with patch('os.getuid', return_value=os.getuid() + 1):
+            assert ask_daemon("Q", server.socket_path) is None
+
+        chat.chat.assert_not_called()
+
+    def test_socket_is_private(self, running_daemon):
+        """Test only the daemon's owner can use its socket."""
+        server, _ = running_daemon
+
+        assert stat.S_IMODE(server.socket_path.stat().st_mode) == 0o600
+
+    def test_default_socket_path_is_per_user(self, monkeypatch):
+        """Test the temp directory fallback includes the user's uid."""
+        monkeypatch.delenv("SV_AGENT_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
+        assert default_socket_path().name == f"sv-agent-{os.getuid()}.sock"
+
+    def test_stale_socket_is_replaced(self, tmp_path):
+        """Test a leftover socket file does not block startup."""
+        socket_path = tmp_path / "sv-agent.sock"
+        socket_path.touch()
+
+        server = SVAgentDaemon(Mock(), socket_path)
+        server.server_close()
+
+        assert not socket_path.exists()
+
+
+class TestAskCommand:
+    """Test cases for how the ask command uses the daemon."""
+
+    def test_daemon_error_exits_cleanly(self, capsys):
+        """Test a daemon error reply is reported like any other error."""
+        with patch('sv_agent.daemon.ask_daemon', side_effect=RuntimeError("model not loaded")):
+            with pytest.raises(SystemExit) as exc_info:
+                main(["ask", "What is a deletion?"])
+
+        assert exc_info.value.code == 1
+        assert "Error: model not loaded" in capsys.readouterr().err
+
+    def test_daemon_answer_is_printed(self, capsys):
+        """Test a running daemon answers without building a local chat."""
+        with patch('sv_agent.daemon.ask_daemon', return_value="A deletion is...") as mock_ask, \
+             patch('sv_agent.SVAgent') as mock_agent_class:
+            main(["ask", "What", "is", "a", "deletion?"])
+
+        mock_ask.assert_called_once_with("What is a deletion?")
+        mock_agent_class.assert_not_called()
+        assert capsys.readouterr().out == "A deletion is...\n"
+
+    @pytest.mark.parametrize("options", [
+        ["--kb-only"],
+        ["--model", "models/other"],
+        ["--use-api"],
+    ])
+    def test_model_options_skip_daemon(self, options, capsys):
+        """Test asks that configure their own model don't use the daemon."""
+        with patch('sv_agent.daemon.ask_daemon') as mock_ask, \
+             patch('sv_agent.SVAgent'), \
+             patch('sv_agent.chat.SVAgentChat') as mock_chat_class:
+            mock_chat_class.return_value.chat.return_value = "local answer"
+            main(options + ["ask", "What is a deletion?"])
+
+        mock_ask.assert_not_called()
+        assert capsys.readouterr().out == "local answer\n"
@@ -88,10 +88,10 @@ echo "================================"
 echo "You can test the chat interface with:"
 echo ""
 echo "  # With Gemma (if available):"
-echo "  sv-agent chat --llm-provider ollama --ollama-model gemma:2b"
+echo "  sv-agent --model models/gemma-2b-it chat"
 echo ""
 echo "  # Without LLM (rule-based):"
-echo "  sv-agent chat --llm-provider none"
+echo "  sv-agent --kb-only chat"
 echo ""
 echo "Example questions to try:"
 echo "  - What is a structural variant?"
@@ -0,0 +1,168 @@
+"""Tests for the natural language executor."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from sv_agent.nl_executor import NaturalLanguageExecutor
+
+
+class TestNaturalLanguageExecutor:
+    """Test cases for prompt parsing in NaturalLanguageExecutor."""
+    
+    @pytest.fixture
+    def executor(self):
+        """Create an executor around a mock agent."""
+        return NaturalLanguageExecutor(Mock())
+    
+    def test_identify_module_from_keyword(self, executor):
+        """Test module keywords map to their module."""
+        plan = executor.parse_execution_request("run QC on my samples")
+        assert plan.module == "Module00a"
+    
+    def test_identify_module_from_number(self, executor):
+        """Test explicit module numbers are normalized."""
+        plan = executor.parse_execution_request("Run module 4 now")
+        assert plan.module == "Module04"
+    
+    def test_identify_module_earliest_keyword(self, executor):
+        """Test the first keyword in the prompt wins, preferring longer ones."""
+        assert executor.parse_execution_request("run batch_qc").module == "Module00c"
+        assert executor.parse_execution_request("check evidence qc").module == "Module00b"
+    
+    def test_unknown_module(self, executor):
+        """Test prompts without a module return None."""
+        assert executor.parse_execution_request("what is this").module is None
+    
+    def test_determine_operation(self, executor):
+        """Test operation keywords select the operation."""
+        assert executor.parse_execution_request("validate QC").operation == "validate"
+        assert executor.parse_execution_request("convert QC").operation == "convert"
+        assert executor.parse_execution_request("QC please").operation == "execute"
+    
+    def test_operation_precedence(self, executor):
+        """Test execute beats validate beats convert wherever they appear."""
+        assert executor._determine_operation("convert then validate") == "validate"
+        assert executor._determine_operation("verify, transform, then running") == "execute"
+    
+    def test_extract_parameters(self, executor):
+        """Test reference, output directory and sample are extracted."""
+        params = executor.parse_execution_request(
+            "run QC with hg38 output to results/ sample id NA12878"
+        ).parameters
+        
+        assert params == {
+            "reference": "hg38",
+            "output_dir": "results/",
+            "sample_id": "NA12878"
+        }
+    
+    def test_extract_quoted_paths(self, executor):
+        """Test quoted file paths are extracted."""
+        files = executor.parse_execution_request("run QC on 'data/a.bam'").files
+        assert "data/a.bam" in files
+    
+    def test_extract_paths_by_extension(self, executor):
+        """Test unquoted paths are extracted whole, not just their extension."""
+        files = executor.parse_execution_request(
+            "run QC on data/s1.bam, S2.CRAM and ref/hg38.fasta"
+        ).files
+        
+        assert files == ["data/s1.bam", "S2.CRAM", "ref/hg38.fasta"]
+    
+    def test_extract_compressed_paths(self, executor):
+        """Test gzip and bgzip suffixes stay part of the path."""
+        files = executor.parse_execution_request(
+            "run QC on calls.VCF.gz and ref.fasta.bgz"
+        ).files
+        
+        assert files == ["calls.VCF.gz", "ref.fasta.bgz"]
+    
+    def test_extract_these_files_compressed(self, executor):
+        """Test listed compressed files are not also added without the suffix."""
+        files = executor.parse_execution_request(
+            "validate these 2 files x.vcf.gz y.bed"
+        ).files
+        
+        assert files == ["x.vcf.gz", "y.bed"]
+    
+    def test_extract_paths_deduplicated_in_order(self, executor):
+        """Test repeated paths are dropped and prompt order is kept."""
+        files = executor.parse_execution_request(
+            "run QC on 'b.bam' then 'a.bam' and 'b.bam'"
+        ).files
+        
+        assert files[:2] == ["b.bam", "a.bam"]
+        assert files.count("b.bam") == 1
+    
+    def test_repeated_prompt_is_cached(self, executor):
+        """Test repeated prompts hit the cache and return independent plans."""
+        first = executor.parse_execution_request("run QC on 'a.bam' with hg38")
+        first.files.append("b.bam")
+        first.parameters["reference"] = "hg19"
+        
+        second = executor.parse_execution_request("run QC on 'a.bam' with hg38")
+        
+        assert second.files == ["a.bam"]
+        assert second.parameters == {"reference": "hg38"}
+        assert executor._parse_prompt.cache_info().hits == 1
+    
+    def test_prepare_sample_qc_inputs(self, executor):
+        """Test sample QC modules get a BAM/CRAM and reference file."""
+        config = executor._prepare_module_inputs(
+            "GatherSampleEvidence", ["a.bam"], {"reference": "hg19"}
+        )
+        
+        assert config == {
+            "bam_or_cram_file": {"class": "File", "path": "a.bam"},
+            "sample_id": "sample1",
+            "reference_fasta": {"class": "File", "path": "/references/hg19.fa"}
+        }
+    
+    def test_dry_run_commands(self, executor):
+        """Test dry runs list the command that would be executed."""
+        executor.knowledge = Mock()
+        executor.knowledge.get_module_info.return_value = {}
+        
+        result = executor.execute_from_prompt("run module 01", dry_run=True)
+        
+        assert result["status"] == "dry_run"
+        assert result["plan"]["commands"] == [
+            "sv-agent run src/sv_agent/cwl/Module01.cwl Module01_inputs.yaml"
+        ]
+    
+    def test_execute_from_prompts(self, executor):
+        """Test a batch of prompts returns one result per prompt in order."""
+        executor.knowledge = Mock()
+        executor.knowledge.get_module_info.return_value = {}
+        prompts = ["run module 01", "what is this", "run module 01"]
+        
+        results = executor.execute_from_prompts(prompts, dry_run=True)
+        
+        assert [r["status"] for r in results] == ["dry_run", "dry_run", "dry_run"]
+        assert results[0]["plan"]["module"] == "Module01"
+        assert results[1]["plan"]["module"] is None
+        assert executor._parse_prompt.cache_info().hits == 1
+    
+    def test_execute_uses_existing_cwl(self, executor, tmp_path):
+        """Test modules with a CWL file run without converting."""
+        (tmp_path / "Module01.cwl").write_text("cwlVersion: v1.2\n")
+        
+        with patch("sv_agent.nl_executor._CWL_DIR", tmp_path):
+            result = executor.execute_from_prompt("run module 01")
+        
+        assert result["status"] == "success"
+        executor.agent.convert_gatksv_to_cwl.assert_not_called()
+        executor.agent.execute_workflow.assert_called_once()
+    
+    def test_execute_converts_missing_cwl_once(self, executor, tmp_path):
+        """Test a missing CWL file is converted and then remembered."""
+        executor.agent.convert_gatksv_to_cwl.side_effect = (
+            lambda output_dir, modules: (output_dir / f"{modules[0]}.cwl").touch()
+        )
+        
+        with patch("sv_agent.nl_executor._CWL_DIR", tmp_path):
+            executor.execute_from_prompt("run module 01")
+            result = executor.execute_from_prompt("run module 01")
+        
+        assert result["status"] == "success"
+        executor.agent.convert_gatksv_to_cwl.assert_called_once_with(tmp_path, ["Module01"])
@@ -2,11 +2,15 @@
 
 import pytest
 import json
+import logging
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, Mock
 
-from sv_agent.main import main
+from sv_agent.main import (
+    main, setup_logging, _get_parser, _selected_command,
+    _is_validation_cached, _record_validation
+)
 
 
 class TestCLIParser:
@@ -26,7 +30,7 @@ class TestCLIParser:
             json.dump(batch_config, f)
         
         # Mock SVAgent
-        with patch('sv_agent.main.SVAgent') as mock_agent_class:
+        with patch('sv_agent.SVAgent') as mock_agent_class:
             mock_agent = Mock()
             mock_agent.process_batch.return_value = {"status": "success"}
             mock_agent_class.return_value = mock_agent
@@ -62,7 +66,7 @@ class TestCLIParser:
             json.dump(agent_config, f)
         
         # Mock SVAgent
-        with patch('sv_agent.main.SVAgent') as mock_agent_class:
+        with patch('sv_agent.SVAgent') as mock_agent_class:
             mock_agent = Mock()
             mock_agent.process_batch.return_value = {"status": "success"}
             mock_agent_class.return_value = mock_agent
@@ -100,7 +104,7 @@ class TestCLIParser:
             json.dump(batch_config, f)
         
         # Mock SVAgent
-        with patch('sv_agent.main.SVAgent') as mock_agent_class:
+        with patch('sv_agent.SVAgent') as mock_agent_class:
             mock_agent = Mock()
             mock_agent.process_batch.return_value = {"status": "success"}
             mock_agent_class.return_value = mock_agent
@@ -111,4 +115,156 @@ class TestCLIParser:
             
             # Verify output directory was created
             assert custom_output.exists()
-            assert (custom_output / "results.json").exists()
\ No newline at end of file
+            assert (custom_output / "results.json").exists()
+
+
+class TestValidationCache:
+    """Test cases for the run command's validation cache."""
+    
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path, monkeypatch):
+        """Point the validation cache at a temporary directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        return tmp_path / "cache"
+    
+    @pytest.fixture
+    def workflow(self, tmp_path):
+        """Create a CWL workflow file."""
+        cwl_file = tmp_path / "workflow.cwl"
+        cwl_file.write_text("cwlVersion: v1.2\nclass: Workflow\n")
+        return cwl_file
+    
+    def test_not_cached_initially(self, workflow):
+        """Test an unseen workflow is not reported as validated."""
+        assert not _is_validation_cached(workflow)
+    
+    def test_cached_after_record(self, workflow, cache_home):
+        """Test a recorded workflow is reported as validated."""
+        _record_validation(workflow)
+        
+        assert _is_validation_cached(workflow)
+        assert (cache_home / "sv-agent" / "validated.json").exists()
+    
+    def test_modified_workflow_invalidates(self, workflow):
+        """Test changing the workflow file invalidates the cache entry."""
+        _record_validation(workflow)
+        workflow.write_text("cwlVersion: v1.2\nclass: CommandLineTool\n")
+        
+        assert not _is_validation_cached(workflow)
+    
+    def test_corrupt_cache_is_ignored(self, workflow, cache_home):
+        """Test a corrupt cache file is treated as empty."""
+        cache_file = cache_home / "sv-agent" / "validated.json"
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{not json")
+        
+        assert not _is_validation_cached(workflow)
+        _record_validation(workflow)
+        assert _is_validation_cached(workflow)
+    
+    @pytest.mark.parametrize("content", ["[]", '"stamp"', "42"])
+    def test_non_object_cache_is_ignored(self, workflow, cache_home, content):
+        """Test a cache file holding valid JSON but not an object is treated as empty."""
+        cache_file = cache_home / "sv-agent" / "validated.json"
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text(content)
+        
+        assert not _is_validation_cached(workflow)
+        _record_validation(workflow)
+        assert _is_validation_cached(workflow)
+
+
+class TestLazyAgent:
+    """Test cases for resolving SVAgent only when a command needs it."""
+    
+    def test_list_does_not_create_agent(self, capsys):
+        """Test commands without an agent never construct one."""
+        with patch('sv_agent.SVAgent') as mock_agent_class:
+            main(["list"])
+        
+        mock_agent_class.assert_not_called()
+        assert "Available GATK-SV Modules" in capsys.readouterr().out
+    
+    def test_agent_resolved_at_call_time(self, capsys):
+        """Test handlers look up sv_agent.SVAgent when they run."""
+        with patch('sv_agent.SVAgent') as mock_agent_class:
+            mock_agent_class.return_value.analyze_gatksv_workflow.return_value = {
+                "name": "GATKSVPipelineBatch"
+            }
+            main(["analyze", "GATKSVPipelineBatch", "--format", "json"])
+        
+        mock_agent_class.assert_called_once_with()
+        assert json.loads(capsys.readouterr().out) == {"name": "GATKSVPipelineBatch"}
+
+
+class TestParserConstruction:
+    """Test cases for lazy, cached parser construction."""
+    
+    def test_parser_is_cached(self):
+        """Test repeated lookups reuse the same parser."""
+        assert _get_parser("list") is _get_parser("list")
+        assert _get_parser() is _get_parser()
+    
+    def test_selected_command_skips_option_values(self):
+        """Test global option values are not mistaken for the command."""
+        assert _selected_command(["--model", "chat", "list"]) == "list"
+        assert _selected_command(["-v", "--model=x", "run", "w.cwl"]) == "run"
+    
+    def test_unknown_or_missing_command_builds_all(self):
+        """Test help and errors fall back to the full parser."""
+        assert _selected_command(["--help"]) is None
+        assert _selected_command(["bogus"]) is None
+    
+    def test_help_before_command_lists_all_commands(self, capsys):
+        """Test top-level help shows every command, not just the one named."""
+        assert _selected_command(["-h", "chat"]) is None
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main(["-h", "chat"])
+        
+        assert exc_info.value.code == 0
+        out = capsys.readouterr().out
+        assert "{convert,analyze,chat,ask,daemon,list,run}" in out
+    
+    def test_abbreviated_global_option_builds_all(self):
+        """Test an abbreviated value option's value isn't taken for the command."""
+        assert _selected_command(["--mod", "list", "chat"]) is None
+        
+        args = _get_parser(_selected_command(["--mod", "list", "chat"])).parse_args(
+            ["--mod", "list", "chat"]
+        )
+        assert args.model == "list"
+        assert args.command == "chat"
+    
+    def test_repeated_main_calls(self, capsys):
+        """Test main() can be invoked repeatedly with the cached parser."""
+        for _ in range(2):
+            with pytest.raises(SystemExit) as exc_info:
+                main(["list", "--help"])
+            assert exc_info.value.code == 0
+        
+        assert "--details" in capsys.readouterr().out
+
+
+class TestSetupLogging:
+    """Test cases for CLI logging setup."""
+    
+    def test_configures_when_unconfigured(self):
+        """Test basicConfig runs when the root logger has no handlers."""
+        root = Mock(handlers=[])
+        with patch('logging.getLogger', return_value=root), \
+             patch('logging.basicConfig') as mock_basic_config:
+            setup_logging(verbose=True)
+        
+        mock_basic_config.assert_called_once()
+        assert mock_basic_config.call_args.kwargs['level'] == logging.DEBUG
+    
+    def test_keeps_existing_handlers(self):
+        """Test an existing logging setup is only re-levelled."""
+        root = Mock(handlers=[logging.NullHandler()])
+        with patch('logging.getLogger', return_value=root), \
+             patch('logging.basicConfig') as mock_basic_config:
+            setup_logging(verbose=False)
+        
+        mock_basic_config.assert_not_called()
+        root.setLevel.assert_called_once_with(logging.INFO)
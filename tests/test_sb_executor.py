@@ -0,0 +1,139 @@
+"""Tests for the Seven Bridges executor."""
+
+import pytest
+
+from sv_agent.sb_executor import SevenBridgesExecutor
+
+
+class TestSevenBridgesExecutor:
+    """Test cases for request parsing in SevenBridgesExecutor."""
+    
+    @pytest.fixture
+    def executor(self):
+        """Create an executor without an agent."""
+        return SevenBridgesExecutor()
+    
+    def test_no_instance_dict(self, executor):
+        """Test executors only carry their slotted attributes."""
+        assert not hasattr(executor, "__dict__")
+        with pytest.raises(AttributeError):
+            executor.platforms = {}
+    
+    def test_extract_module_from_number(self, executor):
+        """Test explicit module numbers are normalized."""
+        assert executor._extract_module("run module 4 please") == "Module04"
+    
+    def test_extract_module_from_keyword(self, executor):
+        """Test module keywords map to their module."""
+        assert executor._extract_module("run clustering") == "Module01"
+        assert executor._extract_module("what is this") is None
+    
+    def test_extract_module_longest_keyword(self, executor):
+        """Test longer keywords win over the ones they contain."""
+        assert executor._extract_module("run batch qc") == "Module00c"
+        assert executor._extract_module("run gathersampleevidence") == "GatherSampleEvidence"
+        assert executor._extract_module("run gather sample evidence") == "GatherSampleEvidence"
+    
+    def test_extract_project(self, executor):
+        """Test project IDs are found with or without the keyword."""
+        assert executor._extract_project("use project alice/sv-run") == "alice/sv-run"
+        assert executor._extract_project("in bob/kids_first") == "bob/kids_first"
+        assert executor._extract_project("no project here") is None
+    
+    def test_extract_instance_size_priority(self, executor):
+        """Test size keywords follow priority order, not prompt order."""
+        assert executor._extract_instance_size("memory heavy quick test") == "small"
+        assert executor._extract_instance_size("needs high memory") == "large"
+        assert executor._extract_instance_size("batch of samples") == "medium"
+    
+    def test_extract_instance_size_whole_words(self, executor):
+        """Test size keywords only match whole words."""
+        assert executor._extract_instance_size("run the program on the latest data") is None
+        assert executor._extract_instance_size("a program that needs more ram") == "memory"
+    
+    def test_extract_sbg_files(self, executor):
+        """Test platform file paths are extracted."""
+        files = executor._extract_file_references("run on sbg://alice/proj/s1.bam")
+        assert "sbg://alice/proj/s1.bam" in files
+    
+    def test_extract_local_files_whole_paths(self, executor):
+        """Test local paths are extracted whole, not just their extension."""
+        files = executor._extract_file_references(
+            "run on data/x.cram, 'my file.vcf' and ref/hg38.fasta"
+        )
+        
+        assert files == ["data/x.cram", "my file.vcf", "ref/hg38.fasta"]
+    
+    def test_extract_compressed_files(self, executor):
+        """Test gzip and bgzip suffixes stay part of the path."""
+        files = executor._extract_file_references(
+            "use sample.vcf.gz, 'my calls.VCF.bgz' and ref.fa"
+        )
+        
+        assert files == ["sample.vcf.gz", "my calls.VCF.bgz", "ref.fa"]
+    
+    def test_extract_files_deduplicated_in_order(self, executor):
+        """Test repeated files are dropped and prompt order is kept."""
+        files = executor._extract_file_references("b.bam sbg://p/a.bam b.bam")
+        assert files == ["b.bam", "sbg://p/a.bam"]
+    
+    def test_extract_no_files(self, executor):
+        """Test prompts without files return an empty list."""
+        assert executor._extract_file_references("run clustering") == []
+    
+    def test_complete_request_is_ready(self, executor):
+        """Test a request naming everything needs no follow-up questions."""
+        result = executor.initiate_execution_dialog(
+            "Run module 01 on cgc in project alice/proj with sbg://alice/proj/s1.bam large"
+        )
+        
+        assert result["status"] == "ready"
+        assert result["plan"]["platform"] == "cgc"
+        assert result["plan"]["instance_size"] == "large"
+    
+    def test_missing_fields_generate_questions(self, executor):
+        """Test missing fields are asked about in order."""
+        result = executor.initiate_execution_dialog("run clustering on gcp")
+        
+        assert result["status"] == "needs_info"
+        assert [q["field"] for q in result["questions"]] == [
+            "files", "project", "instance_size"
+        ]
+    
+    def test_repeated_prompt_is_cached(self, executor):
+        """Test repeated prompts hit the cache and return independent plans."""
+        first = executor._parse_sb_request("run clustering on 'a.bam'")
+        first["files"].append("b.bam")
+        
+        second = executor._parse_sb_request("run clustering on 'a.bam'")
+        
+        assert second["files"] == ["a.bam"]
+        assert executor._parse_prompt.cache_info().hits == 1
+    
+    def test_generate_sb_commands(self, executor):
+        """Test CLI commands are filled in from the plan."""
+        plan = executor._parse_sb_request(
+            "run module 01 on cgc in project alice/proj with sbg://alice/proj/s1.bam large"
+        )
+        commands = executor.generate_sb_commands(plan)
+        
+        assert commands[1] == "sb config set endpoint https://cgc-api.sbgenomics.com/v2"
+        assert "  --app alice/proj/module01 \\" in commands
+        assert commands[-4] == "  --instance-type c5.9xlarge"
+    
+    def test_update_plan_with_numeric_platform(self, executor):
+        """Test numbered platform answers select the platform in order."""
+        plan = executor._parse_sb_request("run clustering")
+        updated = executor.update_plan_with_response(plan, "platform", "2")
+        
+        assert updated["platform"] == "cavatica"
+        assert plan["platform"] is None
+    
+    def test_update_plan_files_deduplicated(self, executor):
+        """Test file answers drop repeats and keep their order."""
+        plan = executor._parse_sb_request("run clustering")
+        updated = executor.update_plan_with_response(
+            plan, "files", "sbg://p/b.bam, a.cram and sbg://p/b.bam"
+        )
+        
+        assert updated["files"] == ["sbg://p/b.bam", "a.cram"]